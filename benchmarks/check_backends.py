@@ -0,0 +1,43 @@
+"""
+Equivalence check and timing of the geometry backends.
+
+Every registered backend is compared with the pure Python one on the shared
+cases of src.geometry_backends.equivalence_cases; the exit status is 1 if
+any kernel disagrees. Then the scalar call time of every kernel is printed.
+
+Usage (from the repository root):
+    python -m benchmarks.check_backends
+"""
+import argparse
+import sys
+import timeit
+
+from src import geometry_backends
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Check geometry backends against each other and time them.")
+    parser.add_argument("--backends", nargs="+", help="backends to check, all registered ones by default")
+    parser.add_argument("--count", type=int, default=2000, help="random cases of each kind")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--calls", type=int, default=2000, help="calls timed per kernel")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    backends = args.backends or geometry_backends.available_backends()
+    mismatches = geometry_backends.check_equivalence(backends, args.count, args.seed)
+    cases = geometry_backends.equivalence_cases(1, args.seed)
+    print(f"{'backend':<8} {'kernel':<18} {'mismatches':>10} {'us/call':>8}")
+    for (backend, name), errors in mismatches.items():
+        call = geometry_backends.kernel(name, backend)
+        arguments = cases[name][0]
+        seconds = timeit.timeit(lambda: call(*arguments), number=args.calls) / args.calls
+        print(f"{backend:<8} {name:<18} {errors:>10} {1e6 * seconds:>8.2f}")
+    if any(mismatches.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmarks of every pipeline stage over polygon sizes, with fixed seeds.
+
+Records wall time (best of several repeats) and peak traced memory of each
+stage to a JSON file, and compares against a saved baseline to flag regressions.
+
+Usage (from the repository root):
+    python -m benchmarks.run_benchmarks --output bench.json
+    python -m benchmarks.run_benchmarks --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from src import constant_parameters
+from src.build_polygon_edges import build_polygon_edges
+from src.check_belonging_to_polygon import point_position_with_respect_to_polygon, classify_points
+from src.engine import JammingSimulation
+from src.generate_points_and_polygon import generate_points_and_polygon
+from src.order_edge import order_edges, order_cycle
+from src.prepared_polygon import PreparedPolygon
+
+SIZES = (24, 100, 1000, 10000)
+LARGE_SIZES = (100000,)
+SEED = 20240601
+QUERIES = 1000
+
+
+def random_points(n, seed=SEED):
+    return np.random.default_rng(seed + n).random((n, 2)) * np.array(constant_parameters.RESOLUTION)
+
+
+def stages(n):
+    """
+    Yield (stage name, callable, setup) triples for polygon size n.
+    Inputs of every stage are prepared here, outside of the timed callables;
+    a stage with a setup callable gets a fresh result of it before every call.
+    """
+    points = random_points(n)
+    edges, _ = build_polygon_edges(points)
+    vertices, _ = order_cycle(edges, points)
+    queries = np.random.default_rng(SEED).random((QUERIES, 2)) * np.array(constant_parameters.RESOLUTION)
+    single = [tuple(q) for q in queries[:100]]
+
+    def fresh_simulation():
+        # Every repeat starts from the same vertices with all of them evaluated;
+        # building the indices is not part of the step
+        return JammingSimulation(np.array(vertices, dtype=np.float64), active_tolerance=None)
+
+    yield "generate_points_and_polygon", lambda: generate_points_and_polygon(points.copy()), None
+    yield "build_polygon_edges", lambda: build_polygon_edges(points), None
+    yield "order_edges", lambda: order_edges(set(edges)), None
+    yield "order_cycle", lambda: order_cycle(edges, points), None
+    yield "point_position_x100", lambda: [point_position_with_respect_to_polygon(q, vertices) for q in single], None
+    yield f"classify_points_x{QUERIES}", lambda: classify_points(queries, vertices), None
+    yield f"prepared_classify_x{QUERIES}", lambda: PreparedPolygon(vertices).classify(queries), None
+    yield "jam_in_step", lambda simulation: simulation.step(True), fresh_simulation
+    yield "jam_out_step", lambda simulation: simulation.step(False), fresh_simulation
+
+
+def measure(function, repeat, setup=None):
+    """
+    Return (best wall time in seconds, peak traced memory in bytes) of function.
+    With a setup callable, function is called with a fresh result of setup every time.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        arguments = () if setup is None else (setup(),)
+        start = time.perf_counter()
+        function(*arguments)
+        best = min(best, time.perf_counter() - start)
+    arguments = () if setup is None else (setup(),)
+    tracemalloc.start()
+    function(*arguments)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def run(sizes, repeat):
+    results = []
+    for n in sizes:
+        for name, function, setup in stages(n):
+            seconds, peak = measure(function, repeat if n < 10000 else 1, setup)
+            results.append({"stage": name, "n": n, "seconds": seconds, "peak_bytes": peak})
+            print(f"{name:>28} n={n:<7} {seconds * 1e3:10.3f} ms {peak / 2**20:9.2f} MiB", flush=True)
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "seed": SEED,
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold):
+    """Return list of messages about stages slower than baseline by more than threshold."""
+    reference = {(r["stage"], r["n"]): r for r in baseline["results"]}
+    regressions = []
+    for r in report["results"]:
+        old = reference.get((r["stage"], r["n"]))
+        if old is None:
+            continue
+        if r["seconds"] > old["seconds"] * (1 + threshold):
+            regressions.append(f"{r['stage']} n={r['n']}: time {old['seconds'] * 1e3:.3f} -> {r['seconds'] * 1e3:.3f} ms")
+        if r["peak_bytes"] > old["peak_bytes"] * (1 + threshold):
+            regressions.append(f"{r['stage']} n={r['n']}: peak memory {old['peak_bytes']} -> {r['peak_bytes']} bytes")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark pipeline stages over polygon sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--large", action="store_true", help=f"also run sizes {LARGE_SIZES}")
+    parser.add_argument("--repeat", type=int, default=5, help="repeats per stage, best time is kept")
+    parser.add_argument("--output", default="bench_output.json", help="JSON file for this run")
+    parser.add_argument("--baseline", help="JSON file of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative slowdown")
+    parser.add_argument("--save-baseline", help="also save this run as a baseline file")
+    args = parser.parse_args(argv)
+
+    sizes = list(args.sizes) + (list(LARGE_SIZES) if args.large else [])
+    report = run(sizes, args.repeat)
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=1)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for message in regressions:
+            print("REGRESSION", message)
+        if regressions:
+            sys.exit(1)
+        print("no regressions against", args.baseline)
+
+
+if __name__ == "__main__":
+    main()
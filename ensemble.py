@@ -0,0 +1,45 @@
+import argparse
+import itertools
+
+import numpy as np
+
+from src import constant_parameters
+from src.ensemble import run_ensemble, save_table
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Jam many random polygons over a process pool.")
+    parser.add_argument("--seeds", type=int, default=100, help="number of seeds, 0..seeds-1")
+    parser.add_argument("--num-points", type=int, nargs="+", default=[constant_parameters.NUM_POINTS])
+    parser.add_argument("--tempo", type=float, nargs="+", default=[constant_parameters.JAMMING_TEMPO])
+    parser.add_argument("--processes", type=int, help="worker processes, defaults to CPU count")
+    parser.add_argument("--chunksize", type=int, help="jobs per task submitted to a worker")
+    parser.add_argument("--timeout", type=float, help="per-job time limit in seconds")
+    parser.add_argument("--max-iterations", type=int, help="limit of jamming iterations per job")
+    parser.add_argument("--shift-tolerance", type=float, default=0.0,
+                        help="converged once no vertex moves more than this")
+    parser.add_argument("--adaptive-tempo", action="store_true", help="adjust tempo while jamming")
+    parser.add_argument("--output", default="ensemble.npz", help="result table, .npz")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    jobs = list(itertools.product(range(args.seeds), args.num_points, args.tempo))
+    table = run_ensemble(jobs, args.processes, args.chunksize, args.timeout, args.max_iterations,
+                         args.shift_tolerance, args.adaptive_tempo)
+    save_table(args.output, table)
+    status = table["status"]
+    ok = status == "ok"
+    print(f"{len(jobs)} jobs: {np.count_nonzero(ok)} ok, "
+          f"{np.count_nonzero(status == 'generation_failed')} generation failures, "
+          f"{np.count_nonzero(status == 'timeout')} timeouts")
+    converged = ok & table["converged"]
+    if converged.any():
+        print(f"{np.count_nonzero(converged)} converged, mean iterations to converge "
+              f"{table['iterations'][converged].mean():.1f}, mean final/initial area "
+              f"{np.mean(table['final_area'][converged] / table['initial_area'][converged]):.3f}")
+
+
+if __name__ == "__main__":
+    main()
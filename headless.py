@@ -0,0 +1,101 @@
+import argparse
+import csv
+import sys
+
+from src import constant_parameters
+from src.adaptive_tempo import AdaptiveTempo
+from src.engine import JammingSimulation, random_polygon
+from src.jammer import SCHEDULES
+from src.instrumentation import Instrumentation
+from src.polygon_cache import PolygonCache
+from src.polygon_io import load_polygon, save_polygon, export_trajectory
+from src.stop_criteria import StopCriteria
+from src.trajectory import TrajectoryWriter
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Jam a polygon without rendering it.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--input", help="polygon vertices in order (or a point cloud to build a polygon over), "
+                        ".npy, .csv with x,y rows, .wkt or .geojson")
+    source.add_argument("--seed", type=int, help="seed of a random polygon")
+    parser.add_argument("--num-points", type=int, default=constant_parameters.NUM_POINTS,
+                        help="number of vertices of a random polygon")
+    parser.add_argument("--cache", action="store_true",
+                        help="load the random polygon from, or store it to, " + constant_parameters.POLYGON_CACHE_DIR)
+    parser.add_argument("--out", action="store_true", help="expand the polygon instead of jamming it in")
+    parser.add_argument("--iterations", type=int, help="maximal number of iterations")
+    parser.add_argument("--no-convergence-stop", action="store_true",
+                        help="run all iterations even when no vertex moves anymore")
+    parser.add_argument("--shift-tolerance", type=float, default=0.0,
+                        help="converged once no vertex moves more than this")
+    parser.add_argument("--patience", type=int, default=1,
+                        help="consecutive steps below the shift tolerance needed to converge")
+    parser.add_argument("--tempo", type=float, default=constant_parameters.JAMMING_TEMPO)
+    parser.add_argument("--adaptive-tempo", action="store_true",
+                        help="grow tempo while moves are accepted, shrink it after rejections")
+    parser.add_argument("--schedule", choices=SCHEDULES, default=constant_parameters.SCHEDULE,
+                        help="update order: all vertices from the previous iterate (jacobi), one by one "
+                             "(gauss_seidel), or alternating classes of non-adjacent vertices (red_black)")
+    parser.add_argument("--no-edge-check", action="store_true", help="do not reject edge crossing moves")
+    parser.add_argument("--remesh-every", type=int, default=constant_parameters.REMESH_EVERY,
+                        help="remove nearly collinear or crowded vertices and split long edges every N iterations")
+    parser.add_argument("--output", help="file for final vertices, .npy, .csv, .wkt or .geojson")
+    parser.add_argument("--metrics", help="csv file for per-iteration metrics")
+    parser.add_argument("--trajectory", help="file streaming vertices of every iteration, for replay in main.py")
+    parser.add_argument("--export-trajectory",
+                        help="convert the recorded trajectory to .csv, .wkt, .geojson or .npy after the run")
+    parser.add_argument("--counters", action="store_true", help="print rejection counters and stage timers")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.input is not None:
+        vertices, built = load_polygon(args.input)
+        if built:
+            print(f"{args.input} is not a simple polygon, built one over its {len(vertices)} points")
+    else:
+        vertices = random_polygon(args.seed, args.num_points, cache=PolygonCache() if args.cache else None)
+    if args.iterations is None and args.no_convergence_stop:
+        sys.exit("--no-convergence-stop requires --iterations")
+    if args.export_trajectory and not args.trajectory:
+        sys.exit("--export-trajectory requires --trajectory")
+
+    controller = AdaptiveTempo(args.tempo) if args.adaptive_tempo else None
+    instrumentation = Instrumentation() if args.counters else None
+    recorder = TrajectoryWriter(args.trajectory) if args.trajectory else None
+    simulation = JammingSimulation(vertices, tempo=args.tempo, check_edge_crossings=not args.no_edge_check,
+                                   tempo_controller=controller, instrumentation=instrumentation,
+                                   recorder=recorder, remesh_every=args.remesh_every,
+                                   schedule=args.schedule)
+    shift_tolerance = None if args.no_convergence_stop else args.shift_tolerance
+    criteria = StopCriteria(args.iterations, shift_tolerance, args.patience)
+    try:
+        history = simulation.run(criteria, inward=not args.out)
+    finally:
+        if recorder is not None:
+            recorder.close()
+
+    if args.output:
+        save_polygon(args.output, simulation.vertices)
+    if args.export_trajectory:
+        export_trajectory(args.trajectory, args.export_trajectory)
+    if args.metrics and history:
+        with open(args.metrics, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(history[0]))
+            writer.writeheader()
+            writer.writerows(history)
+    seconds = sum(m["seconds"] for m in history)
+    print(f"{len(history)} iterations of {len(vertices)} vertices ({len(simulation.vertices)} at the end) in {seconds:.3f} s"
+          f" ({len(history) / max(seconds, 1e-12):.1f} iterations/s), stopped: {simulation.stop_reason}")
+    if instrumentation is not None:
+        snapshot = instrumentation.snapshot()
+        for name, value in snapshot["counters"].items():
+            print(f"{name:>28}: {value}")
+        for name, timer in snapshot["timers"].items():
+            print(f"{name:>28}: {1e3 * timer['total']:.1f} ms in {timer['count']} calls")
+
+
+if __name__ == "__main__":
+    main()
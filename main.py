@@ -1,26 +1,128 @@
+import argparse
+import logging
+import time
+
 import pygame as pg
 import numpy as np
 from scipy.spatial import Delaunay
 
 from src import constant_parameters
-from src.generate_points_and_polygon import generate_points_and_polygon
-from src.check_belonging_to_polygon import point_position_with_respect_to_polygon as pprp
-from src.jammer import generate_points_from_polygon_in as jam_in
-from src.jammer import generate_points_from_polygon_out as jam_out
+from src.polygon_cache import PolygonCache
+from src.polygon_pool import PolygonPool, generate_polygon
+from src.engine import JammingSimulation
+from src.instrumentation import Instrumentation
+from src.renderer import PolygonRenderer
+from src.simulation_worker import SimulationWorker
+from src.trajectory import TrajectoryReader, TrajectoryWriter
+
+def draw_overlay(screen, font, lines):
+    """Draw lines of text over a black box in the bottom left corner, return their rects."""
+    y = constant_parameters.RESOLUTION[1] - 10 - 20 * len(lines)
+    rects = []
+    for line in lines:
+        text_surface = font.render(line, True, constant_parameters.CURSOR_COLOR, (0,0,0))
+        rects.append(screen.blit(text_surface, (10, y)))
+        y += 20
+    return rects
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate and jam polygons interactively.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--record", help="stream vertices of every iteration to this trajectory file")
+    mode.add_argument("--replay", help="replay a trajectory file instead of simulating")
+    parser.add_argument("--seed", type=int, help="seed of the first polygon, Backspace moves to the next seed")
+    parser.add_argument("--no-cache", action="store_true", help="always build polygons instead of loading them from "
+                        + constant_parameters.POLYGON_CACHE_DIR)
+    return parser.parse_args(argv)
+
+def replay(screen, clock, font, path):
+    """
+    Show a recorded trajectory, seeking without recomputing anything.
+
+    Left/Right step one frame, Down/Up ten frames, Home/End jump to the ends,
+    Space plays or pauses, dragging with the mouse scrubs along the whole run.
+    """
+    reader = TrajectoryReader(path)
+    if len(reader) == 0:
+        raise ValueError(f"Trajectory {path} has no frames.")
+    renderer = PolygonRenderer(screen)
+    width = constant_parameters.RESOLUTION[0]
+    frame = 0
+    shown = None
+    playing = False
+    show_overlay = True
+    running = True
+    while running:
+        for event in pg.event.get():
+            if event.type == pg.QUIT:
+                running = False
+            elif event.type == pg.KEYDOWN:
+                if event.key == pg.K_q:
+                    running = False
+                if event.key == pg.K_i:
+                    show_overlay = not show_overlay
+                if event.key == pg.K_SPACE:
+                    playing = not playing
+                    reader.refresh()
+                steps = {pg.K_RIGHT: 1, pg.K_LEFT: -1, pg.K_UP: 10, pg.K_DOWN: -10,
+                         pg.K_HOME: -len(reader), pg.K_END: len(reader)}
+                frame += steps.get(event.key, 0)
+        if pg.mouse.get_pressed()[0]:
+            frame = round(pg.mouse.get_pos()[0] / (width - 1) * (len(reader) - 1))
+        if playing:
+            frame += 1
+            if frame >= len(reader):
+                # The trajectory may still be growing
+                reader.refresh()
+                playing = frame < len(reader)
+        frame = min(max(frame, 0), len(reader) - 1)
+
+        if frame != shown:
+            if shown is None or frame != shown + 1:
+                # Trails only make sense when frames follow each other
+                renderer.reset()
+            renderer.draw_polygon(reader[frame])
+            shown = frame
+        if show_overlay:
+            lines = [f"frame {frame + 1}/{len(reader)}, iteration {reader.iteration(frame)}, "
+                     f"{len(reader[frame])} vertices"]
+            for rect in draw_overlay(screen, font, lines):
+                renderer.mark_dirty(rect)
+        renderer.present()
+        clock.tick(constant_parameters.FPS)
 
-def main():
+def main(argv=None):
+    args = parse_args(argv)
     pg.init()
     screen = pg.display.set_mode(constant_parameters.RESOLUTION)
     pg.display.set_caption("Polygon Edges with Enhanced Point Insertion")
     clock = pg.time.Clock()
     font = pg.font.SysFont(None, 18)
-    points, edges, triangulation, ordered_vertices = generate_points_and_polygon()
+    if args.replay:
+        replay(screen, clock, font, args.replay)
+        pg.quit()
+        return
+    recorder = TrajectoryWriter(args.record) if args.record else None
+    cache = None if args.no_cache else PolygonCache()
+    # Every polygon comes from a seed, shown in the overlay, so that any of them can be reproduced
+    seed = args.seed if args.seed is not None else int(np.random.SeedSequence().entropy % 2**32)
+    instrumentation = Instrumentation()
+    with instrumentation.timer("generation"):
+        seed, points, edges, triangulation, ordered_vertices = generate_polygon(seed, cache=cache)
+    pool = PolygonPool(seed + 1, cache=cache)
+    regenerate = False
+    # The worker records published frames only, so replaced polygons never interleave
+    worker = SimulationWorker(JammingSimulation(ordered_vertices, instrumentation=instrumentation),
+                              recorder=recorder).start()
+    renderer = PolygonRenderer(screen)
+    renderer.reset(points, triangulation.simplices)
+    show_overlay = False
     running = True
     skip_edges = False
     draw_labels = False
     jamming = False
     expanding = False
-    triangulation_already_drawn = False
+    last_error = None
     while running:
         for event in pg.event.get():
             if event.type == pg.QUIT:
@@ -28,87 +130,86 @@ def main():
             elif event.type == pg.KEYDOWN:
                 if event.key == pg.K_q:
                     running = False
+                if event.key == pg.K_i:
+                    show_overlay = not show_overlay
                 if event.key == pg.K_PAGEUP:
                     expanding = not expanding
                     jamming = False
+                    worker.set_direction(False if expanding else None)
                 if event.key == pg.K_PAGEDOWN:
                     jamming = not jamming
                     expanding = False
+                    worker.set_direction(True if jamming else None)
                 if event.key == pg.K_BACKSPACE:
-                # Regenerate polygon on backspace key press
-                    screen.fill(constant_parameters.BACKGROUND_COLOR)
-                    skip_edges = False
-                    points, edges, triangulation, ordered_vertices = generate_points_and_polygon()
-                    triangulation_already_drawn = False
-
-        # to see trajectories
-        screen.fill(constant_parameters.BACKGROUND_COLOR, special_flags=pg.BLEND_RGBA_MAX)
-        #screen.fill(constant_parameters.BACKGROUND_COLOR)
-
-        # Draw inner triangulation edges
-        for (p1i, p2i, p3i) in triangulation.simplices:
-            if triangulation_already_drawn:
-                break
-            pg.draw.aaline(screen,
-                               constant_parameters.TRIANGULATION_EDGE_COLOR,
-                               points[p1i],
-                               points[p2i])
-            pg.draw.aaline(screen,
-                               constant_parameters.TRIANGULATION_EDGE_COLOR,
-                               points[p2i],
-                               points[p3i])
-            pg.draw.aaline(screen,
-                               constant_parameters.TRIANGULATION_EDGE_COLOR,
-                               points[p3i],
-                               points[p1i])
-        triangulation_already_drawn = True
-        # Draw polygon edges
-        for n in range(len(ordered_vertices)):
-            if skip_edges:
-                continue
-            pg.draw.aaline(screen,
-                               constant_parameters.EDGE_COLOR,
-                               ordered_vertices[n-1],
-                               ordered_vertices[n])
-        # skip_edges = True
-
-        # Draw points
-        for n, v in enumerate(ordered_vertices):
-            pg.draw.circle(screen,
-                               ((10 * n + 30) % 256, 15, 0),
-                               (v[0], v[1]),
-                               constant_parameters.POINT_RADIUS)
+                # Regenerate polygon on backspace key press, as soon as the pool has one ready
+                    regenerate = True
+
+        if regenerate and pool.ready():
+            regenerate = False
+            skip_edges = False
+            with instrumentation.timer("generation"):
+                try:
+                    seed, points, edges, triangulation, ordered_vertices = pool.get()
+                except ValueError as error:
+                    logging.warning("Polygon generation failed: %s", error)
+                    last_error = str(error)
+                else:
+                    # The worker builds the simulation, the renderer draws the triangulation over the next frames
+                    worker.set_simulation(ordered_vertices, instrumentation=instrumentation)
+                    renderer.reset(points, triangulation.simplices)
 
+        render_start = time.perf_counter()
+        # Latest snapshot published by the worker, the loop never waits for a step
+        ordered_vertices, _ = worker.snapshot()
+        renderer.draw_triangulation()
+        renderer.draw_polygon(ordered_vertices, draw_edges=not skip_edges)
 
         if draw_labels:
             # Draw a cursor
             mouse_x, mouse_y = pg.mouse.get_pos()
-            pg.draw.circle(screen,
+            renderer.mark_dirty(pg.draw.circle(screen,
                                constant_parameters.CURSOR_COLOR,
                                (mouse_x, mouse_y),
-                               1)
+                               1))
 
-            pg.draw.circle(screen,
+            renderer.mark_dirty(pg.draw.circle(screen,
                                constant_parameters.CURSOR_COLOR,
                                (mouse_x, mouse_y),
                                constant_parameters.CURSOR_RADIUS * 0,
-                               1)
+                               1))
 
             # Put label of mouse position
             text_surface = font.render(f"Mouse: ({mouse_x}, {mouse_y})", True, constant_parameters.CURSOR_COLOR, (0,0,0))
-            screen.blit(text_surface, (10, 10))
+            renderer.mark_dirty(screen.blit(text_surface, (10, 10)))
 
             # Put label of point type
-            text_surface = font.render(f"Point is: {pprp((mouse_x, mouse_y), ordered_vertices)}", True, constant_parameters.CURSOR_COLOR, (0,0,0))
-            screen.blit(text_surface, (10, 30))
+            # Answered by the worker from its prepared index, at most a step late
+            answer = worker.query_position((mouse_x, mouse_y))
+            text_surface = font.render(f"Point is: {answer[1] if answer is not None else '...'}", True, constant_parameters.CURSOR_COLOR, (0,0,0))
+            renderer.mark_dirty(screen.blit(text_surface, (10, 30)))
 
+        if show_overlay:
+            last_metrics, steps_per_second = worker.statistics()
+            lines = [f"seed: {seed}" + (" (next polygon pending)" if regenerate else ""),
+                     f"iterations/s: {steps_per_second}"]
+            if last_metrics is not None:
+                lines.append(f"ms per step: {1e3 * last_metrics['seconds']:.2f}")
+                lines.append(f"acceptance: {last_metrics['accepted']}/{last_metrics['evaluated']}")
+            generation = instrumentation.timer_last.get("generation", 0.0)
+            rendering = instrumentation.timer_last.get("rendering", 0.0)
+            lines.append(f"ms generation: {1e3 * generation:.1f}, rendering: {1e3 * rendering:.1f}")
+            if last_error is not None:
+                lines.append(f"last generation error: {last_error}")
+            for rect in draw_overlay(screen, font, lines):
+                renderer.mark_dirty(rect)
 
-        pg.display.flip()
+        renderer.present()
+        instrumentation.record("rendering", time.perf_counter() - render_start)
         clock.tick(constant_parameters.FPS)
-        if jamming:
-            ordered_vertices = jam_in(ordered_vertices, tempo=constant_parameters.JAMMING_TEMPO)
-        if expanding:
-            ordered_vertices = jam_out(ordered_vertices, tempo=constant_parameters.JAMMING_TEMPO)
+    worker.stop()
+    pool.close()
+    if recorder is not None:
+        recorder.close()
     pg.quit()
 
 
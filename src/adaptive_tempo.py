@@ -0,0 +1,35 @@
+class AdaptiveTempo:
+    """
+    Tempo controller for jamming steps.
+
+    The tempo grows by a factor while moves keep being accepted, and shrinks
+    by another factor after a step in which more moves were rejected than in
+    the previous one, staying within [min_tempo, max_tempo].
+    """
+
+    def __init__(self, tempo, grow=1.1, shrink=0.5, min_tempo=0.1, max_tempo=100.0):
+        self.tempo = tempo
+        self.grow = grow
+        self.shrink = shrink
+        self.min_tempo = min_tempo
+        self.max_tempo = max_tempo
+        self.rejected = None
+
+    def update(self, accepted, evaluated):
+        """
+        Adjust the tempo after a step.
+
+        Args:
+            accepted: number of vertices moved by the step.
+            evaluated: number of vertices the step tried to move.
+
+        Returns:
+            Tempo for the next step.
+        """
+        rejected = evaluated - accepted
+        if self.rejected is not None and rejected > self.rejected:
+            self.tempo = max(self.min_tempo, self.tempo * self.shrink)
+        elif accepted > 0:
+            self.tempo = min(self.max_tempo, self.tempo * self.grow)
+        self.rejected = rejected
+        return self.tempo
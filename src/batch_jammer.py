@@ -0,0 +1,139 @@
+import numpy as np
+
+from src.check_belonging_to_polygon import on_segments, ray_crossings, PAIRS_PER_CHUNK, INNER, OUTER, EDGE
+from src.interpolate_points import interpolate_points_array
+from src.jammer import points_strictly_in_triangles
+
+
+def pack_polygons(polygons):
+    """
+    Pack polygons into one ragged array.
+
+    Args:
+        polygons: sequence of arrays of shape (n_j, 2) or lists of tuples, vertices in order.
+
+    Returns:
+        Tuple (points, offsets): points of shape (sum n_j, 2) with all vertices,
+        polygon j occupying rows offsets[j]:offsets[j + 1].
+    """
+    arrays = [np.asarray(p, dtype=np.float64).reshape(-1, 2) for p in polygons]
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum([len(a) for a in arrays], out=offsets[1:])
+    points = np.concatenate(arrays) if arrays else np.zeros((0, 2))
+    return points, offsets
+
+
+def unpack_polygons(points, offsets):
+    """Inverse of pack_polygons, returns list of (n_j, 2) views into points."""
+    return [points[offsets[j]:offsets[j + 1]] for j in range(len(offsets) - 1)]
+
+
+def ragged_neighbours(offsets):
+    """
+    Cyclic neighbours within every polygon of a ragged array.
+
+    Returns:
+        Tuple (polygon, previous, next) of arrays with one entry per vertex:
+        the polygon it belongs to and the indices of its neighbours.
+    """
+    lengths = np.diff(offsets)
+    polygon = np.repeat(np.arange(len(lengths)), lengths)
+    index = np.arange(offsets[-1])
+    starts, ends = offsets[:-1][polygon], offsets[1:][polygon]
+    previous = np.where(index == starts, ends - 1, index - 1)
+    following = np.where(index == ends - 1, starts, index + 1)
+    return polygon, previous, following
+
+
+def same_polygon_pairs(rows, polygon, offsets):
+    """
+    Pair every row with every vertex of its own polygon.
+
+    Returns:
+        Tuple (owners, partners): positions into rows and the vertex paired with them.
+    """
+    counts = np.diff(offsets)[polygon[rows]]
+    owners = np.repeat(np.arange(len(rows)), counts)
+    within = np.arange(len(owners)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owners, offsets[polygon[rows]][owners] + within
+
+
+def row_chunks(rows, polygon, offsets):
+    """Split rows into consecutive chunks of about PAIRS_PER_CHUNK same-polygon pairs."""
+    pairs = np.cumsum(np.diff(offsets)[polygon[rows]])
+    bounds = np.searchsorted(pairs, np.arange(PAIRS_PER_CHUNK, pairs[-1] if len(pairs) else 0, PAIRS_PER_CHUNK))
+    return np.split(rows, np.unique(np.maximum(bounds, 1)))
+
+
+def jam_polygons(points, offsets, tempo=1, inward=True, epsilon=1e-12):
+    """
+    One jamming step of many polygons at once, as jam_points without indices
+    would do for each of them, in vectorized passes over the ragged array.
+
+    Args:
+        points: array of shape (N, 2) with vertices of all polygons (see pack_polygons).
+        offsets: int array of shape (k + 1,), polygon j is points[offsets[j]:offsets[j + 1]].
+        tempo: jamming tempo, a scalar or an array of shape (k,) with one tempo per polygon.
+        inward: move to centroids inside the polygons if True, outside otherwise.
+        epsilon: numerical tolerance for closeness checks.
+
+    Returns:
+        Tuple (new points of shape (N, 2), int array of shape (k,) with accepted moves per polygon).
+    """
+    points = np.asarray(points, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if len(offsets) > 1 and np.diff(offsets).min() < 3:
+        raise ValueError("Polygon must have at least 3 vertices to form triangles.")
+    polygon, previous, following = ragged_neighbours(offsets)
+    a, b, c = points[previous], points, points[following]
+    centroids = (a + b + c) / 3.0
+    lower, upper = np.minimum(np.minimum(a, b), c), np.maximum(np.maximum(a, b), c)
+    span = upper - lower
+    with np.errstate(divide="ignore"):
+        steps = np.broadcast_to(tempo, len(offsets) - 1)[polygon] / np.sqrt(2*span[:, 0] + 2*span[:, 1])
+
+    # Emptiness of the triangle around every vertex, against the vertices of its own polygon.
+    # Only vertices inside the (slightly widened) bounding box of a triangle can be strictly inside it.
+    margin = epsilon + 1e-9 * (1 + np.abs(points).max(initial=0))
+    lower, upper = lower - margin, upper + margin
+    movable = np.zeros(len(points), dtype=bool)
+    for rows in row_chunks(np.arange(len(points)), polygon, offsets):
+        owners, partners = same_polygon_pairs(rows, polygon, offsets)
+        triplet = rows[owners]
+        q = points[partners]
+        near = np.all((q >= lower[triplet]) & (q <= upper[triplet]), axis=1)
+        near &= (partners != triplet) & (partners != previous[triplet]) & (partners != following[triplet])
+        near = np.flatnonzero(near)
+        t = triplet[near]
+        inner = points_strictly_in_triangles(q[near], a[t], b[t], c[t], epsilon)
+        movable[rows] = np.bincount(owners[near[inner]], minlength=len(rows)) == 0
+
+    # Position of centroids of movable vertices against the edges of their own polygon;
+    # boundary tests only for edges whose bounding box holds the centroid, crossings only
+    # for edges spanning its height
+    wanted = INNER if inward else OUTER
+    candidates = np.flatnonzero(movable)
+    for rows in row_chunks(candidates, polygon, offsets) if len(candidates) else ():
+        owners, edges = same_polygon_pairs(rows, polygon, offsets)
+        x, y = centroids[rows][owners, 0], centroids[rows][owners, 1]
+        vx, vy = points[edges, 0], points[edges, 1]
+        nx, ny = points[following[edges], 0], points[following[edges], 1]
+        py = points[previous[edges], 1]
+        near = np.flatnonzero((np.minimum(vx, nx) - epsilon <= x) & (x <= np.maximum(vx, nx) + epsilon)
+                              & (np.minimum(vy, ny) - epsilon <= y) & (y <= np.maximum(vy, ny) + epsilon))
+        on_vertex = (np.abs(x[near] - vx[near]) <= epsilon) & (np.abs(y[near] - vy[near]) <= epsilon)
+        on_edge = on_segments(x[near], y[near], vx[near], vy[near], nx[near], ny[near], epsilon)
+        on_boundary = np.bincount(owners[near[on_vertex | on_edge]], minlength=len(rows)) > 0
+        spanning = np.flatnonzero((vy > y) != (py > y))
+        e = edges[spanning]
+        crossing = ray_crossings(x[spanning], y[spanning], vx[spanning], vy[spanning],
+                                 points[previous[e], 0], py[spanning], epsilon)
+        crossings = np.bincount(owners[spanning[crossing]], minlength=len(rows))
+        position = np.where(on_boundary, EDGE, np.where(crossings % 2 == 1, INNER, OUTER))
+        movable[rows] = position == wanted
+
+    moved = np.flatnonzero(movable)
+    result = points.copy()
+    result[moved] = interpolate_points_array(points[moved], centroids[moved], steps[moved])
+    accepted = np.bincount(polygon[moved], minlength=len(offsets) - 1)
+    return result, accepted
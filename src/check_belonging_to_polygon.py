@@ -1,18 +1,22 @@
+import numpy as np
+
+from src.geometry_backends import kernel, ORIENTATION_NAMES
+from src.polygon import Polygon
+
+# Integer codes of point positions returned by classify_points
+OUTER, INNER, EDGE, VERTEX = 0, 1, 2, 3
+POSITION_NAMES = ("outer", "inner", "edge", "vertex")
+
+# Upper bound on the number of (point, edge) pairs tested at once
+PAIRS_PER_CHUNK = 1 << 20
+
 def orientation_type(points, epsilon=1e-12):
     """
     Helper function to compute orientation of three points.
     Returns one of {"clockwise", "counterclockwise", "collinear", "degenerate"}.
     """
-    p1, p2, p3 = [tuple(map(float, pt)) for pt in points]
-    if len({p1, p2, p3}) < 3:
-        return "degenerate"
-    cross = (p2[0] - p1[0]) * (p3[1] - p1[1]) - (p2[1] - p1[1]) * (p3[0] - p1[0])
-    if abs(cross) < epsilon:
-        return "collinear"
-    elif cross > 0:
-        return "counterclockwise"
-    else:
-        return "clockwise"
+    p1, p2, p3 = points
+    return ORIENTATION_NAMES[int(kernel("orientation_type")(p1, p2, p3, epsilon))]
 
 def is_point_on_segment(p, a, b, epsilon=1e-12):
     """
@@ -33,24 +37,87 @@ def point_in_polygon(point, polygon, epsilon=1e-12):
     Returns True if point is strictly inside polygon,
     False if outside.
     """
-    x, y = point
-    inside = False
-    n = len(polygon)
-    
-    for i in range(n):
-        j = (i - 1) % n  # Previous vertex index
-        xi, yi = polygon[i]
-        xj, yj = polygon[j]
-
-        # Check if edge intersects horizontal ray from point to the right
-        # Condition: point's y between edge's ys, and intersection x > x of point
-        if ((yi > y) != (yj > y)):
-            # Compute intersection of edge with horizontal line at y
-            intersect_x = (xj - xi) * (y - yi) / (yj - yi + 1e-20) + xi
-            if intersect_x > x + epsilon:
-                inside = not inside
-    
-    return inside
+    return bool(kernel("point_in_polygon")(point, polygon, epsilon))
+
+def on_segments(x, y, ax, ay, bx, by, epsilon=1e-12):
+    """
+    Elementwise is_point_on_segment for arrays of coordinates broadcastable against each other.
+    Points coinciding with a segment end, or degenerate segments, are not "on" it,
+    exactly as orientation_type reports "degenerate" for them.
+    """
+    distinct = ((ax != bx) | (ay != by)) & ((x != ax) | (y != ay)) & ((x != bx) | (y != by))
+    cross = (bx - ax) * (y - ay) - (by - ay) * (x - ax)
+    in_box = ((np.minimum(ax, bx) - epsilon <= x) & (x <= np.maximum(ax, bx) + epsilon)
+              & (np.minimum(ay, by) - epsilon <= y) & (y <= np.maximum(ay, by) + epsilon))
+    return distinct & (np.abs(cross) < epsilon) & in_box
+
+def ray_crossings(x, y, xi, yi, xj, yj, epsilon=1e-12):
+    """
+    Elementwise step of point_in_polygon: True where the horizontal ray from (x, y)
+    to the right crosses the edge from (xi, yi) to its previous vertex (xj, yj).
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        intersect_x = (xj - xi) * (y - yi) / (yj - yi + 1e-20) + xi
+    return ((yi > y) != (yj > y)) & (intersect_x > x + epsilon)
+
+def on_segment(x, y, ax, ay, bx, by, epsilon=1e-12):
+    """Scalar on_segments for Python floats, with the same arithmetic; faster for single queries."""
+    if (ax == bx and ay == by) or (x == ax and y == ay) or (x == bx and y == by):
+        return False
+    cross = (bx - ax) * (y - ay) - (by - ay) * (x - ax)
+    return (abs(cross) < epsilon and min(ax, bx) - epsilon <= x <= max(ax, bx) + epsilon
+            and min(ay, by) - epsilon <= y <= max(ay, by) + epsilon)
+
+def ray_crossing(x, y, xi, yi, xj, yj, epsilon=1e-12):
+    """Scalar ray_crossings for Python floats, with the same arithmetic."""
+    if (yi > y) == (yj > y):
+        return False
+    return (xj - xi) * (y - yi) / (yj - yi + 1e-20) + xi > x + epsilon
+
+def classify_points(points, polygon, epsilon=1e-12):
+    """
+    Batched point_position_with_respect_to_polygon.
+
+    Classifies every query point against one polygon in a vectorized pass.
+
+    Args:
+        points: array of shape (m, 2) with query points.
+        polygon: array of shape (n, 2), list of tuples or Polygon with polygon vertices;
+            a Polygon also lets points outside its cached bounding box skip the edge tests.
+        epsilon: numerical tolerance for closeness checks.
+
+    Returns:
+        int8 array of shape (m,) with codes OUTER, INNER, EDGE or VERTEX,
+        POSITION_NAMES maps them back to strings.
+    """
+    queries = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if isinstance(polygon, Polygon):
+        lower, upper = polygon.bbox
+        in_box = np.all((queries >= lower - epsilon) & (queries <= upper + epsilon), axis=1)
+        if not in_box.all():
+            codes = np.full(len(queries), OUTER, dtype=np.int8)
+            codes[in_box] = classify_points(queries[in_box], polygon.vertices, epsilon)
+            return codes
+    polygon = np.asarray(polygon, dtype=np.float64)
+    m, n = len(queries), len(polygon)
+    x, y = queries[:, 0:1], queries[:, 1:2]
+    on_vertex = np.zeros(m, dtype=bool)
+    on_edge = np.zeros(m, dtype=bool)
+    inside = np.zeros(m, dtype=bool)
+    chunk = max(1, PAIRS_PER_CHUNK // max(m, 1))
+    for start in range(0, n, chunk):
+        idx = np.arange(start, min(start + chunk, n))
+        vx, vy = polygon[idx, 0], polygon[idx, 1]
+        nx, ny = polygon[(idx + 1) % n, 0], polygon[(idx + 1) % n, 1]
+        px, py = polygon[idx - 1, 0], polygon[idx - 1, 1]
+        on_vertex |= ((np.abs(x - vx) <= epsilon) & (np.abs(y - vy) <= epsilon)).any(axis=1)
+        on_edge |= on_segments(x, y, vx, vy, nx, ny, epsilon).any(axis=1)
+        inside ^= np.logical_xor.reduce(ray_crossings(x, y, vx, vy, px, py, epsilon), axis=1)
+    codes = np.full(m, OUTER, dtype=np.int8)
+    codes[inside] = INNER
+    codes[on_edge] = EDGE
+    codes[on_vertex] = VERTEX
+    return codes
 
 def point_position_with_respect_to_polygon(point, polygon, epsilon=1e-12):
     """
@@ -66,21 +133,4 @@ def point_position_with_respect_to_polygon(point, polygon, epsilon=1e-12):
     Returns:
         String describing point's position relative to polygon.
     """
-    # Check if point matches any vertex (within epsilon)
-    for v in polygon:
-        if abs(point[0] - v[0]) <= epsilon and abs(point[1] - v[1]) <= epsilon:
-            return "vertex"
-
-    # Check if point lies on any polygon edge
-    n = len(polygon)
-    for i in range(n):
-        a = polygon[i]
-        b = polygon[(i + 1) % n]
-        if is_point_on_segment(point, a, b, epsilon):
-            return "edge"
-    
-    # Check inside/outside using ray casting algorithm (excluding boundary)
-    if point_in_polygon(point, polygon, epsilon):
-        return "inner"
-    else:
-        return "outer"
+    return POSITION_NAMES[classify_points([point], polygon, epsilon)[0]]
@@ -10,7 +10,28 @@ CURSOR_RADIUS = 12
 POINT_COLOR = (255, 215, 0)    # Gold/yellow
 EDGE_COLOR = (0, 255, 255)     # Cyan
 TRIANGULATION_EDGE_COLOR = (7, 0, 63)
+# Triangulation edges drawn per frame after switching polygons
+TRIANGULATION_EDGES_PER_FRAME = 3000
 
 JAMMING_TEMPO=2
+CHECK_EDGE_CROSSINGS = True  # reject vertex moves whose new edges cross other edges
+ACTIVE_TOLERANCE = 0.0       # vertices moving at most this fraction of the step's largest shift
+                             # (with neighbours and nearby triangles) are not re-evaluated;
+                             # above 0 small moves are postponed, which slows convergence
+SCHEDULE = "jacobi"          # update order of a jamming step: "jacobi", "gauss_seidel" or "red_black"
+GEOMETRY_BACKEND = "python"  # backend of the scalar geometric predicates, see src/geometry_backends.py
+
+POLYGON_CACHE_DIR = ".polygon_cache"     # generated polygons by seed, see src/polygon_cache.py
+POLYGON_CACHE_MAX_ENTRIES = 256
+POLYGON_CACHE_MAX_BYTES = 256 * 2**20
+POLYGON_POOL_SIZE = 4       # polygons generated ahead in the background, see src/polygon_pool.py
+POLYGON_POOL_WORKERS = 1
+POLYGON_RETRIES = 8         # failed constructions are retried with fresh points
+
+REMESH_EVERY = None                 # steps between remeshing (src/remesh.py), None disables it
+REMESH_COLLINEAR_TOLERANCE = 0.01   # vertex height above its neighbours' chord, relative to the chord
+REMESH_MIN_SPACING = 0.2            # times the current perimeter over the initial vertex count
+REMESH_MAX_EDGE = 2.0               # times the current perimeter over the initial vertex count
+REMESH_MIN_VERTICES = 0.5           # decimation stops at this fraction of the initial vertex count
 
 
@@ -0,0 +1,20 @@
+import numpy as np
+
+def edge_to_triangles(tri):
+    """
+    Map every edge of a triangulation to the simplices sharing it.
+
+    Args:
+        tri: scipy.spatial.Delaunay triangulation.
+
+    Returns:
+        dict mapping edge_key-sorted (i, j) tuples to lists of simplex indices (one or two).
+    """
+    simplices = tri.simplices
+    pairs = np.stack([simplices[:, [0, 1]], simplices[:, [1, 2]], simplices[:, [2, 0]]], axis=1).reshape(-1, 2)
+    pairs.sort(axis=1)
+    owners = np.repeat(np.arange(len(simplices)), 3)
+    mapping = dict()
+    for (i, j), s in zip(pairs.tolist(), owners.tolist()):
+        mapping.setdefault((i, j), []).append(s)
+    return mapping
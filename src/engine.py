@@ -0,0 +1,198 @@
+import time
+
+import numpy as np
+
+from src import constant_parameters
+from src.generate_points_and_polygon import generate_points_and_polygon
+from src.jammer import jam_points, active_vertices, displacement_statistics
+from src.polygon import Polygon
+from src.prepared_polygon import PreparedPolygon
+from src.remesh import remesh
+from src.segment_grid import SegmentGrid
+from src.stop_criteria import StopCriteria
+from src.vertex_grid import VertexGrid
+
+
+class JammingSimulation:
+    """
+    Headless jamming of one polygon.
+
+    Holds the vertices together with the indices the jammer keeps up to date
+    (vertex grid, prepared polygon, optional segment grid, active set), and
+    steps them as fast as the CPU allows, independently of any rendering.
+    """
+
+    def __init__(self, vertices, tempo=constant_parameters.JAMMING_TEMPO,
+                 check_edge_crossings=constant_parameters.CHECK_EDGE_CROSSINGS,
+                 active_tolerance=constant_parameters.ACTIVE_TOLERANCE, tempo_controller=None,
+                 instrumentation=None, recorder=None, remesh_every=constant_parameters.REMESH_EVERY,
+                 schedule=constant_parameters.SCHEDULE):
+        """
+        Args:
+            vertices: array of shape (n, 2) or list of tuples with polygon vertices in order.
+            tempo: jamming tempo passed to jam_points.
+            check_edge_crossings: reject moves creating edge crossings (see SegmentGrid).
+            active_tolerance: fraction of the largest vertex shift of a step below which
+                vertices are not re-evaluated in the next one (see active_vertices);
+                None re-evaluates every vertex on every step.
+            tempo_controller: optional AdaptiveTempo; when given, it sets the tempo of
+                every step and overrides tempo.
+            instrumentation: optional Instrumentation receiving rejection counters and
+                the jam_step timer; it is exported after every step.
+            recorder: optional TrajectoryWriter receiving the initial vertices and
+                the vertices after every step.
+            remesh_every: remesh (see src/remesh.py) after every this many steps, None never;
+                thresholds are the REMESH_* factors times the current perimeter divided by
+                the vertex count of the polygon given to set_vertices, so the count stays
+                close to it while the polygon shrinks or grows.
+            schedule: update order of the jamming step, one of jammer.SCHEDULES.
+        """
+        self.tempo = tempo if tempo_controller is None else tempo_controller.tempo
+        self.tempo_controller = tempo_controller
+        self.instrumentation = instrumentation
+        self.recorder = recorder
+        self.check_edge_crossings = check_edge_crossings
+        self.active_tolerance = active_tolerance
+        self.remesh_every = remesh_every
+        self.schedule = schedule
+        self.iteration = 0
+        self.set_vertices(vertices)
+
+    def set_vertices(self, vertices):
+        """Replace the polygon and rebuild all indices."""
+        self.build_indices(vertices)
+        self.target_vertices = len(self.vertices)
+        if self.recorder is not None:
+            self.recorder.append(self.vertices, self.iteration)
+
+    def build_indices(self, vertices):
+        """Take vertices, possibly of another count, and rebuild the indices over them."""
+        # The Polygon is passed through jam_points and the indices as is, jam_points
+        # hands back a new one without copying, and the remesh takes its cached edges
+        self.vertices = Polygon(vertices)
+        self.vertex_index = VertexGrid(self.vertices)
+        self.prepared = PreparedPolygon(self.vertices)
+        self.segment_index = SegmentGrid(self.vertices) if self.check_edge_crossings else None
+        self.reactivate()
+
+    def remesh(self, inward=True):
+        """
+        Remesh the polygon and rebuild the indices if any vertex was removed or inserted.
+        Jamming in (inward) the remeshed polygon lies inside the current one, otherwise it contains it.
+
+        Returns:
+            Tuple (number of removed vertices, number of inserted vertices).
+        """
+        edges = self.vertices.edge_vectors
+        target_edge = float(np.sum(np.hypot(edges[:, 0], edges[:, 1]))) / self.target_vertices
+        min_vertices = max(3, int(constant_parameters.REMESH_MIN_VERTICES * self.target_vertices))
+        vertices, removed, inserted = remesh(self.vertices,
+                                             constant_parameters.REMESH_COLLINEAR_TOLERANCE,
+                                             constant_parameters.REMESH_MIN_SPACING * target_edge,
+                                             constant_parameters.REMESH_MAX_EDGE * target_edge,
+                                             min_vertices, inward)
+        if removed or inserted:
+            self.build_indices(vertices)
+        return removed, inserted
+
+    def reactivate(self):
+        """Re-evaluate every vertex on the next step, e.g. after a change of direction."""
+        self.active = None
+        self.inward = None
+
+    def step(self, inward=True):
+        """
+        Advance the polygon by one jamming step.
+
+        Returns:
+            dict of metrics of the step: iteration, tempo, evaluated and accepted vertices,
+            partial (True if only the active vertices were evaluated), largest and mean vertex shift, vertex count, vertices removed and inserted
+            by remeshing, and seconds.
+        """
+        if inward != self.inward:
+            self.active = None
+            self.inward = inward
+        start = time.perf_counter()
+        previous = self.vertices
+        evaluated = len(previous) if self.active is None else int(np.count_nonzero(self.active))
+        tempo = self.tempo
+        self.vertices = jam_points(previous, tempo, inward, self.vertex_index, self.prepared,
+                                   self.segment_index, self.active, self.instrumentation, self.schedule)
+        if self.active_tolerance is not None:
+            self.active = active_vertices(previous, self.vertices, self.active_tolerance, self.vertex_index)
+            if not self.active.any():
+                # Nothing moved: sweep all vertices once more before the polygon counts as standing
+                self.active = None
+        self.iteration += 1
+        metrics = {"iteration": self.iteration, "tempo": tempo, "evaluated": evaluated,
+                   "partial": evaluated < len(previous)}
+        metrics.update(displacement_statistics(previous, self.vertices))
+        removed = inserted = 0
+        if self.remesh_every and self.iteration % self.remesh_every == 0:
+            removed, inserted = self.remesh(inward)
+        metrics.update(vertex_count=len(self.vertices), removed=removed, inserted=inserted)
+        if self.recorder is not None:
+            self.recorder.append(self.vertices, self.iteration)
+        if self.tempo_controller is not None:
+            self.tempo = self.tempo_controller.update(metrics["accepted"], evaluated)
+        metrics["seconds"] = time.perf_counter() - start
+        if self.instrumentation is not None:
+            self.instrumentation.record("jam_step", metrics["seconds"])
+            self.instrumentation.export()
+        return metrics
+
+    def run(self, criteria=None, inward=True, callback=None):
+        """
+        Step the polygon until the stop criteria are met.
+
+        Args:
+            criteria: StopCriteria, by default stop when no vertex moves anymore.
+            inward: jam in if True, expand otherwise.
+            callback: optional callable receiving metrics of every step.
+
+        Returns:
+            List of metrics dicts, one per step taken; the reason of stopping
+            is left in stop_reason.
+        """
+        criteria = criteria or StopCriteria()
+        criteria.reset()
+        history = []
+        self.stop_reason = None
+        while self.stop_reason is None:
+            metrics = self.step(inward)
+            history.append(metrics)
+            if callback is not None:
+                callback(metrics)
+            self.stop_reason = criteria(metrics)
+            if criteria.needs_sweep:
+                # Frozen vertices may still move, so they are checked before converging
+                self.active = None
+        return history
+
+
+def random_polygon(seed=None, num_points=constant_parameters.NUM_POINTS,
+                   resolution=constant_parameters.RESOLUTION, cache=None):
+    """Generate a polygon on random points drawn from a seeded generator, return ordered vertices."""
+    return generate_points_and_polygon(seed=seed, num_points=num_points, resolution=resolution, cache=cache)[3]
+
+
+def run_jamming(vertices=None, seed=None, num_points=constant_parameters.NUM_POINTS,
+                criteria=None, inward=True, **options):
+    """
+    Library entry point: jam a given polygon, or a random one built from a seed.
+
+    Args:
+        vertices: polygon vertices in order; if None, random_polygon(seed, num_points) is used.
+        seed: seed of the random polygon.
+        num_points: number of vertices of the random polygon.
+        criteria, inward: see JammingSimulation.run.
+        options: further keyword arguments of JammingSimulation.
+
+    Returns:
+        Tuple (final vertices array, list of per-iteration metrics).
+    """
+    if vertices is None:
+        vertices = random_polygon(seed, num_points)
+    simulation = JammingSimulation(vertices, **options)
+    history = simulation.run(criteria, inward)
+    return np.array(simulation.vertices), history
@@ -0,0 +1,120 @@
+import functools
+import math
+import multiprocessing
+import signal
+import time
+
+import numpy as np
+
+from src.adaptive_tempo import AdaptiveTempo
+from src.engine import JammingSimulation, random_polygon
+from src.polygon_area import polygon_area
+from src.stop_criteria import StopCriteria
+
+# Columns of the result table, in order
+COLUMNS = ("seed", "num_points", "tempo", "status", "vertex_count", "iterations",
+           "converged", "initial_area", "final_area", "seconds")
+
+
+class JobTimeout(Exception):
+    """Raised inside a worker when a job exceeds its time limit."""
+
+
+def _raise_timeout(signum, frame):
+    raise JobTimeout()
+
+
+def _jam_job(row, seed, num_points, tempo, max_iterations, shift_tolerance, adaptive_tempo):
+    """Generate and jam the polygon of one job, filling in row as results come."""
+    try:
+        vertices = random_polygon(seed, num_points)
+    except ValueError:
+        row["status"] = "generation_failed"
+        return
+    row["vertex_count"] = len(vertices)
+    row["initial_area"] = abs(polygon_area(vertices))
+    controller = AdaptiveTempo(tempo) if adaptive_tempo else None
+    simulation = JammingSimulation(vertices, tempo=tempo, tempo_controller=controller)
+    history = simulation.run(StopCriteria(max_iterations, shift_tolerance))
+    row["iterations"] = len(history)
+    row["converged"] = simulation.stop_reason == "converged"
+    row["final_area"] = abs(simulation.vertices.area)
+
+
+def run_job(job, timeout=None, max_iterations=None, shift_tolerance=0.0, adaptive_tempo=False):
+    """
+    Generate one random polygon and jam it in until it converges.
+
+    Args:
+        job: tuple (seed, num_points, tempo).
+        timeout: seconds after which the job is abandoned with status "timeout";
+            only enforced where SIGALRM exists, and only between Python bytecodes.
+        max_iterations: optional limit of jamming iterations.
+        shift_tolerance: largest vertex shift of a converged step, see StopCriteria.
+        adaptive_tempo: start from tempo and let AdaptiveTempo adjust it.
+
+    Returns:
+        dict with one value per column of COLUMNS.
+    """
+    seed, num_points, tempo = job
+    row = dict(seed=seed, num_points=num_points, tempo=tempo, status="ok", vertex_count=0,
+               iterations=0, converged=False, initial_area=np.nan, final_area=np.nan)
+    start = time.perf_counter()
+    use_alarm = timeout is not None and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    try:
+        try:
+            if use_alarm:
+                signal.setitimer(signal.ITIMER_REAL, timeout)
+            _jam_job(row, seed, num_points, tempo, max_iterations, shift_tolerance, adaptive_tempo)
+        finally:
+            # Cancel the alarm before anything else; one firing up to here is caught below
+            if use_alarm:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    except JobTimeout:
+        row["status"] = "timeout"
+    except Exception as error:
+        row["status"] = f"error: {type(error).__name__}"
+    finally:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, previous_handler)
+    row["seconds"] = time.perf_counter() - start
+    return row
+
+
+def to_columns(rows):
+    """Turn a list of row dicts into a columnar table: dict of column name -> numpy array."""
+    return {name: np.array([row[name] for row in rows]) for name in COLUMNS}
+
+
+def run_ensemble(jobs, processes=None, chunksize=None, timeout=None, max_iterations=None,
+                 shift_tolerance=0.0, adaptive_tempo=False):
+    """
+    Run many (seed, num_points, tempo) jobs over a process pool.
+
+    Args:
+        jobs: iterable of (seed, num_points, tempo) tuples.
+        processes: number of worker processes, defaults to the CPU count.
+        chunksize: jobs handed to a worker at once; defaults to about four chunks per worker.
+        timeout: per-job time limit in seconds, see run_job.
+        max_iterations: optional limit of jamming iterations per job.
+        shift_tolerance, adaptive_tempo: see run_job.
+
+    Returns:
+        Columnar result table (see to_columns), rows sorted as the jobs were given.
+    """
+    jobs = list(jobs)
+    processes = processes or multiprocessing.cpu_count()
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(jobs) / (4 * processes)))
+    worker = functools.partial(run_job, timeout=timeout, max_iterations=max_iterations,
+                               shift_tolerance=shift_tolerance, adaptive_tempo=adaptive_tempo)
+    with multiprocessing.Pool(processes) as pool:
+        rows = list(pool.imap(worker, jobs, chunksize))
+    return to_columns(rows)
+
+
+def save_table(path, table):
+    """Save a columnar result table as a compressed .npz file."""
+    np.savez_compressed(path, **table)
@@ -1,15 +1,48 @@
 import numpy as np
 from src.constant_parameters import *
 from src.build_polygon_edges import build_polygon_edges
-from src.order_edge import order_edges as sort_edges
+from src.order_edge import order_cycle
+from src.polygon_cache import PolygonCache, Triangulation
 
-def generate_points_and_polygon(points=None):
-    if points is None:
-        points = np.random.rand(NUM_POINTS, 2) * np.array(RESOLUTION)
-    edges, triangulation = build_polygon_edges(points)
-    _edges = sort_edges(edges)
-    _points = list()
-    for e in _edges:
-        # _points.append(points[e[0]].astype(int))
-        _points.append((points[e[0]][0],points[e[0]][1]))
+def generate_points_and_polygon(points=None, seed=None, rng=None, num_points=NUM_POINTS, resolution=RESOLUTION,
+                                cache=None):
+    """
+    Draw random points (unless given) and build a polygon on them.
+
+    Args:
+        points: optional array of shape (n, 2) with input points.
+        seed: seed of the points drawn when points are not given; the same seed
+            gives the same polygon.
+        rng: numpy Generator to draw the points from instead of a seed.
+        num_points: number of drawn points.
+        resolution: points are drawn uniformly from [0, resolution[0]) x [0, resolution[1]).
+        cache: optional PolygonCache; polygons from a seed are looked up by
+            (seed, num_points, resolution), given points by their hash.
+
+    Returns:
+        Tuple (points, polygon edges as index pairs, triangulation with simplices,
+        array of shape (m, 2) with ordered polygon vertices).
+    """
+    key = None
+    if cache is not None and points is None and rng is None and seed is not None:
+        key = PolygonCache.seed_key(seed, num_points, resolution)
+    cached = cache.load(key) if key is not None else None
+    if cached is None:
+        if points is None:
+            rng = rng if rng is not None else np.random.default_rng(seed)
+            points = rng.random((num_points, 2)) * np.array(resolution)
+        if cache is not None and key is None:
+            key = PolygonCache.points_key(points)
+            cached = cache.load(key)
+    if cached is not None:
+        points, simplices, order = cached
+        triangulation = Triangulation(points, simplices)
+        _points = points[order]
+    else:
+        edges, triangulation = build_polygon_edges(points)
+        # Ordered vertices come as a contiguous (n, 2) array, order holds their indices into points
+        _points, order = order_cycle(edges, points)
+        if cache is not None:
+            cache.store(key, points, triangulation.simplices, order)
+    _edges = list(zip(order.tolist(), np.roll(order, -1).tolist()))
     return points, _edges, triangulation, _points
@@ -0,0 +1,226 @@
+"""
+Registry of compute backends for the geometric predicates.
+
+Every backend provides the same kernels with the same arguments and results:
+
+    point_in_triangle(p, a, b, c)           -> bool, p strictly on one side of all edges
+    point_on_segment(p, a, b, eps=1e-9)     -> bool, p collinear with a-b and between them
+    orientation_type(a, b, c, eps=1e-12)    -> int, one of the orientation codes below
+    point_in_polygon(p, polygon, eps=1e-12) -> bool, ray casting, boundary excluded
+
+Points are (x, y) pairs. The "python" backend works on single points with plain
+floats and is the fastest for the scalar calls in hot loops. The "numpy"
+backend additionally broadcasts over arrays of points of shape (..., 2).
+The "numba" backend, registered only if numba is installed, compiles the
+scalar kernels.
+
+The backend used by the wrappers (point_on_segment, point_in_triangle, ...) is
+chosen with set_backend, by default constant_parameters.GEOMETRY_BACKEND.
+"""
+import numpy as np
+
+from src import constant_parameters
+
+# Codes returned by orientation_type kernels
+COLLINEAR, COUNTERCLOCKWISE, CLOCKWISE, DEGENERATE = 0, 1, 2, 3
+ORIENTATION_NAMES = ("collinear", "counterclockwise", "clockwise", "degenerate")
+
+KERNELS = ("point_in_triangle", "point_on_segment", "orientation_type", "point_in_polygon")
+
+_backends = dict()
+_selected = None
+
+
+def register_backend(name, kernels):
+    """
+    Register a backend.
+
+    Args:
+        name: backend name used by set_backend.
+        kernels: dict mapping every name of KERNELS to its implementation.
+    """
+    missing = set(KERNELS) - set(kernels)
+    if missing:
+        raise ValueError(f"Backend {name} misses kernels: {', '.join(sorted(missing))}.")
+    _backends[name] = dict(kernels)
+
+
+def available_backends():
+    return tuple(_backends)
+
+
+def set_backend(name):
+    """Select the backend used by kernel() and the predicate wrappers."""
+    global _selected
+    if name not in _backends:
+        raise ValueError(f"Unknown geometry backend {name}, available: {', '.join(_backends)}.")
+    _selected = name
+
+
+def get_backend():
+    """Return name of the selected backend."""
+    if _selected is None:
+        set_backend(constant_parameters.GEOMETRY_BACKEND)
+    return _selected
+
+
+def kernel(name, backend=None):
+    """Return kernel name of the given backend, or of the selected one."""
+    return _backends[backend or get_backend()][name]
+
+
+# Pure Python scalar kernels
+
+def python_point_in_triangle(p, a, b, c):
+    # Signs written out, so that the numba backend can compile this function as is
+    b1 = (p[0] - b[0]) * (a[1] - b[1]) - (a[0] - b[0]) * (p[1] - b[1]) < 0.0
+    b2 = (p[0] - c[0]) * (b[1] - c[1]) - (b[0] - c[0]) * (p[1] - c[1]) < 0.0
+    b3 = (p[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (p[1] - a[1]) < 0.0
+    return b1 == b2 and b2 == b3
+
+
+def python_point_on_segment(p, a, b, eps=1e-9):
+    apx, apy = p[0] - a[0], p[1] - a[1]
+    abx, aby = b[0] - a[0], b[1] - a[1]
+    if abs(abx * apy - aby * apx) > eps:
+        return False
+    dot = apx * abx + apy * aby
+    return 0 <= dot <= abx * abx + aby * aby
+
+
+def python_orientation_type(a, b, c, eps=1e-12):
+    ax, ay, bx, by, cx, cy = float(a[0]), float(a[1]), float(b[0]), float(b[1]), float(c[0]), float(c[1])
+    if (ax == bx and ay == by) or (bx == cx and by == cy) or (ax == cx and ay == cy):
+        return DEGENERATE
+    cross = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    if abs(cross) < eps:
+        return COLLINEAR
+    return COUNTERCLOCKWISE if cross > 0 else CLOCKWISE
+
+
+def python_point_in_polygon(p, polygon, eps=1e-12):
+    x, y = p[0], p[1]
+    inside = False
+    xj, yj = polygon[-1][0], polygon[-1][1]
+    for vertex in polygon:
+        xi, yi = vertex[0], vertex[1]
+        if (yi > y) != (yj > y):
+            if (xj - xi) * (y - yi) / (yj - yi + 1e-20) + xi > x + eps:
+                inside = not inside
+        xj, yj = xi, yi
+    return inside
+
+
+# Vectorized NumPy kernels, broadcasting over leading dimensions of the point arrays
+
+def _xy(points):
+    points = np.asarray(points, dtype=np.float64)
+    return points[..., 0], points[..., 1]
+
+
+def numpy_point_in_triangle(p, a, b, c):
+    (px, py), (ax, ay), (bx, by), (cx, cy) = _xy(p), _xy(a), _xy(b), _xy(c)
+    b1 = (px - bx) * (ay - by) - (ax - bx) * (py - by) < 0.0
+    b2 = (px - cx) * (by - cy) - (bx - cx) * (py - cy) < 0.0
+    b3 = (px - ax) * (cy - ay) - (cx - ax) * (py - ay) < 0.0
+    return (b1 == b2) & (b2 == b3)
+
+
+def numpy_point_on_segment(p, a, b, eps=1e-9):
+    (px, py), (ax, ay), (bx, by) = _xy(p), _xy(a), _xy(b)
+    apx, apy = px - ax, py - ay
+    abx, aby = bx - ax, by - ay
+    dot = apx * abx + apy * aby
+    return (np.abs(abx * apy - aby * apx) <= eps) & (dot >= 0) & (dot <= abx * abx + aby * aby)
+
+
+def numpy_orientation_type(a, b, c, eps=1e-12):
+    (ax, ay), (bx, by), (cx, cy) = _xy(a), _xy(b), _xy(c)
+    cross = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    codes = np.where(cross > 0, COUNTERCLOCKWISE, CLOCKWISE)
+    codes = np.where(np.abs(cross) < eps, COLLINEAR, codes)
+    degenerate = (((ax == bx) & (ay == by)) | ((bx == cx) & (by == cy)) | ((ax == cx) & (ay == cy)))
+    return np.where(degenerate, DEGENERATE, codes)
+
+
+def numpy_point_in_polygon(p, polygon, eps=1e-12):
+    x, y = _xy(p)
+    xi, yi = _xy(polygon)
+    xj, yj = np.roll(xi, 1), np.roll(yi, 1)
+    x, y = x[..., None], y[..., None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        intersect_x = (xj - xi) * (y - yi) / (yj - yi + 1e-20) + xi
+    crossing = ((yi > y) != (yj > y)) & (intersect_x > x + eps)
+    return np.logical_xor.reduce(crossing, axis=-1)
+
+
+register_backend("python", {
+    "point_in_triangle": python_point_in_triangle,
+    "point_on_segment": python_point_on_segment,
+    "orientation_type": python_orientation_type,
+    "point_in_polygon": python_point_in_polygon,
+})
+register_backend("numpy", {
+    "point_in_triangle": numpy_point_in_triangle,
+    "point_on_segment": numpy_point_on_segment,
+    "orientation_type": numpy_orientation_type,
+    "point_in_polygon": numpy_point_in_polygon,
+})
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    register_backend("numba", {
+        name: numba.njit(cache=True)(globals()[f"python_{name}"]) for name in KERNELS
+    })
+
+
+def equivalence_cases(count=2000, seed=0):
+    """
+    Random kernel inputs with many boundary cases: shared and repeated
+    vertices, points on edges and collinear triplets on a coarse grid.
+
+    Returns:
+        dict mapping kernel name to a list of argument tuples.
+    """
+    rng = np.random.default_rng(seed)
+    # A coarse grid makes exact collinearity and coincidence frequent
+    grid = rng.integers(0, 6, (count, 4, 2)).astype(np.float64)
+    uniform = rng.random((count, 4, 2)) * 10
+    points = np.concatenate([grid, uniform])
+    polygon = np.array([(0, 0), (5, 0), (5, 5), (2.5, 2), (0, 5)], dtype=np.float64)
+    return {
+        "point_in_triangle": [(q[0], q[1], q[2], q[3]) for q in points],
+        "point_on_segment": [(q[0], q[1], q[2]) for q in points],
+        "orientation_type": [(q[0], q[1], q[2]) for q in points],
+        "point_in_polygon": [(q[0], polygon) for q in points],
+    }
+
+
+def check_equivalence(backends=None, count=2000, seed=0, reference="python"):
+    """
+    Compare every backend with the reference backend on equivalence_cases.
+
+    Array backends are also called once on all cases stacked together, which
+    checks their broadcasting against the scalar results.
+
+    Returns:
+        dict mapping (backend, kernel) to the number of mismatching cases.
+    """
+    cases = equivalence_cases(count, seed)
+    mismatches = dict()
+    for backend in backends or available_backends():
+        for name, arguments in cases.items():
+            expected = np.array([kernel(name, reference)(*args) for args in arguments])
+            scalar = np.array([kernel(name, backend)(*args) for args in arguments])
+            errors = int(np.count_nonzero(scalar != expected))
+            if backend == "numpy":
+                stacked = [np.array([args[k] for args in arguments]) for k in range(len(arguments[0]))]
+                if name == "point_in_polygon":
+                    stacked[1] = arguments[0][1]
+                errors = max(errors, int(np.count_nonzero(kernel(name, backend)(*stacked) != expected)))
+            mismatches[(backend, name)] = errors
+    return mismatches
@@ -1,62 +1,70 @@
+import numpy as np
+
 from src.edge_key import edge_key
+from src.edge_to_triangles import edge_to_triangles as build_edge_to_triangles
 from src.third_vertex import third_vertex
+from src.triangle_contains_no_other_points import triangle_contains_no_other_points
 
 
-def insert_missing_points_with_full_triangle_edges(points, edges, tri):
+def insert_missing_points_with_full_triangle_edges(points, edges, tri, edge_to_triangles=None):
     """
-    Insert missing points by adding all edges of the triangle formed with polygon edge.
+    Insert missing points by replacing a polygon edge with the other two edges
+    of the triangle it forms with the missing point.
 
     Conditions:
     - Triangle contains no other point inside except its vertices.
+
+    Missing points are kept in a worklist: a point is re-examined only when
+    a new polygon edge appears next to one of its triangles.
+    Only points left out of the triangulation (tri.coplanar) can lie inside
+    a Delaunay triangle, so only those are tested for emptiness.
+
+    Args:
+        points: array of shape (n, 2) with all points.
+        edges: set of edge_key-sorted polygon edges, updated in place.
+        tri: scipy.spatial.Delaunay triangulation of points.
+        edge_to_triangles: precomputed edge_to_triangles(tri) mapping, built if not given.
     """
+    if edge_to_triangles is None:
+        edge_to_triangles = build_edge_to_triangles(tri)
     polygon_vertices = set()
     for e in edges:
         polygon_vertices.update(e)
 
     missing_points = set(range(len(points))) - polygon_vertices
+    if not missing_points:
+        return edges
+
+    # Simplices around every vertex, as CSR offsets into a vertex-sorted simplex list
+    simplices = tri.simplices
+    owners = np.argsort(simplices.ravel(), kind="stable") // 3
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(simplices.ravel(), minlength=len(points)))])
+    coplanar = np.unique(tri.coplanar[:, 0])
+
+    worklist = list(missing_points)
+    while worklist:
+        missing_idx = worklist.pop()
+        if missing_idx not in missing_points:
+            continue
+        for s in owners[offsets[missing_idx]:offsets[missing_idx + 1]]:
+            simplex = simplices[s].tolist()
+            i, j = [v for v in simplex if v != missing_idx]
+            e = edge_key(i, j)
+            if e not in edges:
+                continue
+            if not triangle_contains_no_other_points(points[simplex], points, set(simplex), coplanar):
+                continue
 
-    # Prepare edge to triangles mapping for quick lookup
-    edge_to_triangles = dict()
-    for simplex in tri.simplices:
-        for k in range(3):
-            e = edge_key(simplex[k], simplex[(k + 1) % 3])
-            if e not in edge_to_triangles:
-                edge_to_triangles[e] = []
-            edge_to_triangles[e].append(simplex)
-
-    inserted_any = True
-    while inserted_any and missing_points:
-        inserted_any = False
-        edges_list = list(edges)
-        for missing_idx in list(missing_points):
-            for e in edges_list:
-                triangles = edge_to_triangles.get(e, [])
-                for simplex in triangles:
-                    v_third = third_vertex(simplex, e)
-                    if v_third != missing_idx:
-                        continue
-
-                    i, j = e
-                    triangle_pts = points[[i, j, v_third]]
-                    exclude_indices = {i, j, v_third}
-
-                    if triangle_contains_no_other_points(triangle_pts, points, exclude_indices):
-                        # Remove old edge and add all triangle edges
-                        edges.discard(e)
-                        new_edges = [
-                            edge_key(i, j),
-                            edge_key(j, v_third),
-                            edge_key(v_third, i)
-                        ]
-                        for ne in new_edges:
-                            edges.add(ne)
-
-                        missing_points.remove(missing_idx)
-                        inserted_any = True
-                        break
-                if inserted_any:
-                    break
-            if inserted_any:
-                break
+            edges.discard(e)
+            new_edges = [edge_key(i, missing_idx), edge_key(j, missing_idx)]
+            edges.update(new_edges)
+            missing_points.remove(missing_idx)
+            # Missing points across the new edges may become insertable
+            for ne in new_edges:
+                for t in edge_to_triangles.get(ne, []):
+                    v = third_vertex(simplices[t].tolist(), ne)
+                    if v in missing_points:
+                        worklist.append(v)
+            break
 
     return edges
@@ -0,0 +1,68 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class Instrumentation:
+    """
+    Counters and timers of a jamming run.
+
+    Counters are plain named integers (e.g. rejections by reason), timers
+    accumulate total, last and count of timed sections. Listeners registered
+    with add_listener receive a snapshot every time export() is called.
+    """
+
+    def __init__(self):
+        self.listeners = []
+        self.reset()
+
+    def reset(self):
+        self.counters = defaultdict(int)
+        self.timer_totals = defaultdict(float)
+        self.timer_last = dict()
+        self.timer_counts = defaultdict(int)
+
+    def count(self, name, amount=1):
+        self.counters[name] += int(amount)
+
+    @contextmanager
+    def timer(self, name):
+        """Context manager adding the wall time of its block to timer name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        """Add a section timed elsewhere to timer name."""
+        self.timer_totals[name] += seconds
+        self.timer_last[name] = seconds
+        self.timer_counts[name] += 1
+
+    def add_listener(self, callback):
+        """Register callback(snapshot) called on every export()."""
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self.listeners.remove(callback)
+
+    def snapshot(self):
+        """
+        Returns:
+            dict with "counters" (name -> count) and "timers"
+            (name -> dict of total, last and count).
+        """
+        return {
+            "counters": dict(self.counters),
+            "timers": {
+                name: {"total": total, "last": self.timer_last[name], "count": self.timer_counts[name]}
+                for name, total in self.timer_totals.items()
+            },
+        }
+
+    def export(self):
+        if self.listeners:
+            snapshot = self.snapshot()
+            for callback in self.listeners:
+                callback(snapshot)
@@ -1,3 +1,5 @@
+import numpy as np
+
 def interpolate_points(p1, p2, t):
     """
     Linearly interpolate between two 2D points p1 and p2 with parameter t.
@@ -15,3 +17,20 @@ def interpolate_points(p1, p2, t):
     x = (1 - t) * p1[0] + t * p2[0]
     y = (1 - t) * p1[1] + t * p2[1]
     return (x, y)
+
+def interpolate_points_array(p1, p2, t):
+    """
+    Vectorized counterpart of interpolate_points for (n, 2) arrays of points.
+    Every row of p1 is moved towards the matching row of p2 by its own t,
+    clipped to [0, 1] exactly as in interpolate_points.
+
+    Args:
+        p1: array of shape (n, 2) with starting points
+        p2: array of shape (n, 2) with target points
+        t: array of shape (n,) with interpolation parameters
+
+    Returns:
+        array of shape (n, 2) with interpolated points
+    """
+    t = np.clip(t, 0.0, 1.0)[:, None]
+    return (1 - t) * p1 + t * p2
@@ -0,0 +1,82 @@
+import numpy as np
+
+from src.geometry_backends import numpy_point_on_segment
+from src.segments_intersect import segments_intersect_array
+
+
+def crossing_edges(vertices, changed=None):
+    """
+    Find what keeps vertices in order from forming a simple polygon.
+
+    Candidate edge pairs share a cell of a uniform grid (as in SegmentGrid),
+    and all of them are tested at once with segments_intersect_array.
+
+    Args:
+        vertices: array of shape (n, 2) with polygon vertices in order, not closed, n >= 3.
+        changed: optional boolean mask of shape (n,) of edges to check (edge i goes from
+            vertex i to vertex i+1); only pairs and folds involving them are reported.
+
+    Returns:
+        Tuple (indices of vertices where the two edges fold back onto each other,
+        arrays e, f with pairs of intersecting non-adjacent edges).
+    """
+    points = np.asarray(vertices, dtype=np.float64)
+    n = len(points)
+    before, after = np.roll(points, 1, axis=0), np.roll(points, -1, axis=0)
+    around = np.arange(n) if changed is None else np.flatnonzero(changed | np.roll(changed, 1))
+    folded = (numpy_point_on_segment(after[around], before[around], points[around])
+              | numpy_point_on_segment(before[around], points[around], after[around]))
+    folds = around[folded]
+    if n == 3:
+        return folds, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    # Bucket edges into the cells of a uniform grid overlapped by their bounding boxes,
+    # as SegmentGrid does, but in one vectorized pass
+    lengths = np.hypot(*(after - points).T)
+    cell_size = float(np.mean(lengths)) or 1.0
+    origin = points.min(axis=0)
+    lower = np.floor((np.minimum(points, after) - origin) / cell_size).astype(np.int64)
+    upper = np.floor((np.maximum(points, after) - origin) / cell_size).astype(np.int64)
+    width = upper[:, 0] - lower[:, 0] + 1
+    spans = width * (upper[:, 1] - lower[:, 1] + 1)
+    edges = np.repeat(np.arange(n), spans)
+    within = np.arange(len(edges)) - np.repeat(np.cumsum(spans) - spans, spans)
+    cx = lower[edges, 0] + within % width[edges]
+    cy = lower[edges, 1] + within // width[edges]
+    cells = cx * (upper[:, 1].max() + 1) + cy
+    order = np.argsort(cells, kind="stable")
+    cells, members = cells[order], edges[order]
+    # Pair every member with the members after it in its own cell
+    starts = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1]])
+    sizes = np.diff(np.r_[starts, len(cells)])
+    ends = np.repeat(starts + sizes, sizes)
+    counts = ends - np.arange(len(members)) - 1
+    first = np.repeat(np.arange(len(members)), counts)
+    second = first + 1 + np.arange(len(first)) - np.repeat(np.cumsum(counts) - counts, counts)
+    e, f = np.minimum(members[first], members[second]), np.maximum(members[first], members[second])
+    gap = f - e
+    keep = (gap != 1) & (gap != n - 1)
+    if changed is not None:
+        keep &= changed[e] | changed[f]
+    pairs = np.unique(e[keep] * n + f[keep])
+    e, f = pairs // n, pairs % n
+    crossing = segments_intersect_array(points[e], points[(e + 1) % n], points[f], points[(f + 1) % n])
+    return folds, e[crossing], f[crossing]
+
+
+def is_simple_polygon(vertices):
+    """
+    Check that vertices in order form a simple polygon: no two non-adjacent edges
+    intersect, and no edge folds back onto its neighbour (which also rejects
+    repeated consecutive vertices). See crossing_edges.
+
+    Args:
+        vertices: array of shape (n, 2) with polygon vertices in order, not closed.
+
+    Returns:
+        True if the polygon is simple.
+    """
+    if len(vertices) < 3:
+        return False
+    folds, e, _ = crossing_edges(vertices)
+    return len(folds) == 0 and len(e) == 0
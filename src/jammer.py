@@ -1,7 +1,11 @@
-#from your_module import point_in_polygon  # Import the auxiliary function from your codebase
-from src.check_belonging_to_polygon import point_position_with_respect_to_polygon as point_in_polygon
-from src.interpolate_points import interpolate_points
-from math import sqrt
+from contextlib import nullcontext
+
+import numpy as np
+from src.check_belonging_to_polygon import classify_points, on_segments, ray_crossings, INNER, OUTER
+from src.check_belonging_to_polygon import on_segment, ray_crossing, PAIRS_PER_CHUNK
+from src.interpolate_points import interpolate_points_array
+from src.prepared_polygon import PreparedPolygon
+from src.polygon import Polygon
 
 def triangle_centroid(a, b, c):
     """Compute centroid of triangle defined by points a, b, c."""
@@ -13,6 +17,276 @@ def max_perimeter(a, b, c):
 def distance(a,b):
     pass
 
+def triplets(points):
+    """Return (previous, current, next) vertex arrays of a cyclic (n, 2) array."""
+    return np.roll(points, 1, axis=0), points, np.roll(points, -1, axis=0)
+
+def triangle_centroids(points):
+    """Centroids of all consecutive triplets, row i belongs to the triplet around vertex i."""
+    a, b, c = triplets(points)
+    return (a + b + c) / 3.0
+
+def max_perimeters(points):
+    """Vectorized max_perimeter of all consecutive triplets."""
+    a, b, c = triplets(points)
+    lower = np.minimum(np.minimum(a, b), c)
+    upper = np.maximum(np.maximum(a, b), c)
+    span = upper - lower
+    return 2*span[:, 0] + 2*span[:, 1]
+
+def points_strictly_in_triangles(queries, a, b, c, epsilon=1e-12):
+    """
+    Elementwise check that queries[k] is "inner" for triangle (a[k], b[k], c[k]),
+    with exactly the same arithmetic as point_position_with_respect_to_polygon.
+    All arguments are arrays of shape (..., 2) broadcastable against each other.
+    """
+    x, y = queries[..., 0], queries[..., 1]
+    corners = (a, b, c)
+    rejected = np.zeros(np.broadcast(x, a[..., 0], b[..., 0], c[..., 0]).shape, dtype=bool)
+    inside = np.zeros_like(rejected)
+    for k in range(3):
+        vx, vy = corners[k][..., 0], corners[k][..., 1]
+        nx, ny = corners[(k + 1) % 3][..., 0], corners[(k + 1) % 3][..., 1]
+        px, py = corners[k - 1][..., 0], corners[k - 1][..., 1]
+        rejected |= (np.abs(x - vx) <= epsilon) & (np.abs(y - vy) <= epsilon)
+        rejected |= on_segments(x, y, vx, vy, nx, ny, epsilon)
+        inside ^= ray_crossings(x, y, vx, vy, px, py, epsilon)
+    return inside & ~rejected
+
+def point_strictly_in_triangle(x, y, a, b, c, epsilon=1e-12):
+    """Scalar points_strictly_in_triangles for Python floats, with the same arithmetic."""
+    corners = (a, b, c)
+    inside = False
+    for k in range(3):
+        (vx, vy), (nx, ny), (px, py) = corners[k], corners[(k + 1) % 3], corners[k - 1]
+        if (abs(x - vx) <= epsilon and abs(y - vy) <= epsilon) or on_segment(x, y, vx, vy, nx, ny, epsilon):
+            return False
+        inside ^= ray_crossing(x, y, vx, vy, px, py, epsilon)
+    return inside
+
+def empty_triangles(points, rows=None):
+    """
+    For every vertex i return True if no vertex other than i-1, i, i+1
+    lies strictly inside the triangle of the triplet around i.
+    If rows are given, only those vertices are tested and the rest are reported False.
+    """
+    n = len(points)
+    a, b, c = triplets(points)
+    if rows is None:
+        rows = np.arange(n)
+    empty = np.zeros(n, dtype=bool)
+    chunk = max(1, PAIRS_PER_CHUNK // n)
+    for start in range(0, len(rows), chunk):
+        block = rows[start:start + chunk]
+        inner = points_strictly_in_triangles(points[None, :, :],
+                                             a[block, None, :], b[block, None, :], c[block, None, :])
+        for shift in (-1, 0, 1):
+            inner[np.arange(len(block)), (block + shift) % n] = False
+        empty[block] = ~inner.any(axis=1)
+    return empty
+
+def active_vertices(previous, current, tolerance, vertex_index=None):
+    """
+    Mask of vertices worth re-evaluating in the next jamming step: those which moved
+    more than tolerance times the largest shift of the step, together with both of
+    their neighbours. With vertex_index (a VertexGrid of current), also vertices whose
+    triangle lies near the old or new position of such a vertex (see
+    VertexGrid.triangles_near), as a vertex leaving a triangle may free its apex.
+    """
+    shift = np.asarray(current) - np.asarray(previous)
+    length = np.hypot(shift[:, 0], shift[:, 1])
+    moved = length > tolerance * length.max()
+    active = moved | np.roll(moved, 1) | np.roll(moved, -1)
+    if vertex_index is not None and moved.any():
+        active |= vertex_index.triangles_near(np.concatenate([np.asarray(previous)[moved],
+                                                              np.asarray(current)[moved]]))
+    return active
+
+def displacement_statistics(previous, current):
+    """
+    Displacement statistics of a jamming step.
+
+    Returns:
+        dict with number of accepted (moved) vertices, largest and mean vertex shift.
+    """
+    diff = np.asarray(current) - np.asarray(previous)
+    shift = np.hypot(diff[:, 0], diff[:, 1])
+    return {
+        "accepted": int(np.count_nonzero(shift)),
+        "max_shift": float(shift.max()),
+        "mean_shift": float(shift.mean()),
+    }
+
+# Update schedules of jam_points
+SCHEDULES = ("jacobi", "gauss_seidel", "red_black")
+
+def vertex_colours(n):
+    """
+    Split vertices of a cyclic polygon into classes without two neighbours in one class:
+    even and odd indices, and for odd n the last vertex on its own.
+    """
+    colours = np.arange(n) % 2
+    if n % 2:
+        colours[-1] = 2
+    return [np.flatnonzero(colours == k) for k in range(colours.max() + 1)]
+
+def jam_points(points, tempo=1, inward=True, vertex_index=None, prepared=None, segment_index=None,
+               active=None, instrumentation=None, schedule="jacobi"):
+    """
+    Array-native jamming step shared by generate_points_from_polygon_in/out.
+    Centroids, quasi-perimeters and interpolants are computed for all vertices at once.
+
+    With the default "jacobi" schedule every vertex moves with respect to the previous
+    iterate. "red_black" moves the colour classes of vertex_colours one after another,
+    each class vectorized and seeing the classes already moved. "gauss_seidel" moves
+    vertices one by one in index order, each seeing all the moves before it.
+
+    Args:
+        points: array of shape (n, 2) or Polygon with vertices in order.
+        tempo: jamming tempo, the step is tempo/sqrt(quasiperimeter) of the way to the centroid.
+        inward: move to centroids inside the polygon if True, outside otherwise.
+        vertex_index: optional VertexGrid over the same vertices; it narrows the
+            emptiness test to nearby vertices and is updated with the moved ones.
+        prepared: optional PreparedPolygon of the same vertices used for the centroid
+            checks; it is updated with the moved vertices as well.
+        segment_index: optional SegmentGrid of the same vertices; when given, moves whose
+            new edges would cross other edges are rejected, so the polygon stays simple
+            (all moves of a step are checked at once, see SegmentGrid.safe_moves, or
+            one by one with the "gauss_seidel" schedule).
+        active: optional boolean mask of vertices to re-evaluate (see active_vertices);
+            the others keep their position, as their last move was below tolerance.
+        instrumentation: optional Instrumentation; counts evaluated and accepted vertices,
+            rejections by reason (rejected_triangle_not_empty, rejected_centroid_position,
+            rejected_edge_crossing) and times the emptiness, centroid and edge checks.
+        schedule: update order, one of SCHEDULES.
+
+    Returns:
+        New array of shape (n, 2) with moved vertices, or a new Polygon if points is one.
+    """
+    polygon_given = isinstance(points, Polygon)
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    if n < 3:
+        raise ValueError("Polygon must have at least 3 vertices to form triangles.")
+    if schedule not in SCHEDULES:
+        raise ValueError(f"Unknown schedule {schedule}, expected one of {', '.join(SCHEDULES)}.")
+    if schedule == "red_black":
+        result = points
+        for colour in vertex_colours(n):
+            mask = np.zeros(n, dtype=bool)
+            mask[colour] = True
+            if active is not None:
+                mask &= active
+            result = jam_points(result, tempo, inward, vertex_index, prepared, segment_index, mask,
+                                instrumentation)
+        return Polygon(result, copy=False) if polygon_given else result
+    if schedule == "gauss_seidel":
+        result = jam_points_sequentially(points, tempo, inward, vertex_index, prepared, segment_index, active,
+                                         instrumentation)
+        return Polygon(result, copy=False) if polygon_given else result
+
+    centroids = triangle_centroids(points)
+    with np.errstate(divide="ignore"):
+        steps = tempo / np.sqrt(max_perimeters(points))
+    wanted = INNER if inward else OUTER
+    rows = None if active is None else np.flatnonzero(active)
+    timer = instrumentation.timer if instrumentation is not None else lambda name: nullcontext()
+    with timer("emptiness_test"):
+        if vertex_index is None:
+            movable = empty_triangles(points, rows)
+        else:
+            movable = vertex_index.empty_triangles(rows)
+    candidates = np.flatnonzero(movable)
+    with timer("centroid_test"):
+        if prepared is None:
+            movable[candidates] = classify_points(centroids[candidates], points) == wanted
+        else:
+            movable[candidates] = prepared.classify(centroids[candidates]) == wanted
+
+    moved = np.flatnonzero(movable)
+    targets = interpolate_points_array(points[moved], centroids[moved], steps[moved])
+    crossing = 0
+    if segment_index is not None:
+        with timer("edge_check"):
+            safe = segment_index.safe_moves(moved, targets)
+            crossing = len(moved) - np.count_nonzero(safe)
+            moved, targets = moved[safe], targets[safe]
+    if instrumentation is not None:
+        evaluated = n if rows is None else len(rows)
+        instrumentation.count("evaluated", evaluated)
+        instrumentation.count("rejected_triangle_not_empty", evaluated - len(candidates))
+        instrumentation.count("rejected_centroid_position", len(candidates) - len(moved) - crossing)
+        instrumentation.count("rejected_edge_crossing", crossing)
+        instrumentation.count("accepted", len(moved))
+
+    result = points.copy()
+    result[moved] = targets
+    if vertex_index is not None:
+        vertex_index.update(result)
+    if prepared is not None:
+        prepared.move_vertices(moved, targets)
+    return Polygon(result, copy=False) if polygon_given else result
+
+def jam_points_sequentially(points, tempo=1, inward=True, vertex_index=None, prepared=None, segment_index=None,
+                            active=None, instrumentation=None):
+    """
+    Gauss-Seidel schedule of jam_points: vertices are moved one at a time, in index order,
+    and the triangle, emptiness test and centroid position of every vertex are
+    evaluated on the polygon with all previous moves of the step applied.
+
+    Every vertex queries the vertex grid and the prepared polygon, which are updated
+    right after each accepted move; when they are not given, temporary ones are built
+    for the step, so that no vertex scans the whole polygon.
+    Arguments and result are those of jam_points.
+    """
+    from src.vertex_grid import VertexGrid
+
+    result = np.array(points, dtype=np.float64)
+    n = len(result)
+    if vertex_index is None:
+        vertex_index = VertexGrid(result)
+    if prepared is None:
+        prepared = PreparedPolygon(result)
+    wanted = INNER if inward else OUTER
+    rows = range(n) if active is None else np.flatnonzero(active)
+    timer = instrumentation.timer if instrumentation is not None else lambda name: nullcontext()
+    counts = dict(evaluated=0, rejected_triangle_not_empty=0, rejected_centroid_position=0,
+                  rejected_edge_crossing=0, accepted=0)
+    for i in rows:
+        counts["evaluated"] += 1
+        a, b, c = result[i - 1].tolist(), result[i].tolist(), result[(i + 1) % n].tolist()
+        with timer("emptiness_test"):
+            lower = (min(a[0], b[0], c[0]), min(a[1], b[1], c[1]))
+            upper = (max(a[0], b[0], c[0]), max(a[1], b[1], c[1]))
+            others = [j for j in vertex_index.query_box(lower, upper) if 1 < (j - i) % n < n - 1]
+            empty = not any(point_strictly_in_triangle(x, y, a, b, c) for x, y in result[others].tolist())
+        if not empty:
+            counts["rejected_triangle_not_empty"] += 1
+            continue
+        centroid = ((a[0] + b[0] + c[0]) / 3.0, (a[1] + b[1] + c[1]) / 3.0)
+        with timer("centroid_test"):
+            inside = prepared.classify_point(*centroid) == wanted
+        if not inside:
+            counts["rejected_centroid_position"] += 1
+            continue
+        with np.errstate(divide="ignore"):
+            step = tempo / np.sqrt(max_perimeter(a, b, c))
+        target = interpolate_points_array(np.array([b]), np.array([centroid]), np.array([step]))[0]
+        if segment_index is not None:
+            with timer("edge_check"):
+                if not segment_index.move_is_safe(i, target):
+                    counts["rejected_edge_crossing"] += 1
+                    continue
+                segment_index.move_vertex(i, target)
+        result[i] = target
+        vertex_index.move_vertex(i, target)
+        prepared.move_vertices([i], target[None, :])
+        counts["accepted"] += 1
+    if instrumentation is not None:
+        for name, value in counts.items():
+            instrumentation.count(name, value)
+    return result
+
 def generate_points_from_polygon_in(input_points, tempo = 1):
     """
     Given a list of 2D points representing a simple polygon (vertices in order),
@@ -29,33 +303,7 @@ def generate_points_from_polygon_in(input_points, tempo = 1):
     Returns:
         List of (x, y) tuples of generated points.
     """
-    n = len(input_points)
-    if n < 3:
-        raise ValueError("Polygon must have at least 3 vertices to form triangles.")
-
-    result = []
-    for i in range(n):
-        a = input_points[(i - 1) % n]
-        b = input_points[(i + 0) % n]
-        c = input_points[(i + 1) % n]
-        triangle_is_completely_inner = True
-        for j, other_points in enumerate(input_points):
-            if j == (i - 1) % n or j == i or j == (i + 1) % n:
-                continue
-            if point_in_polygon(input_points[j], [a, b, c]) == "inner":
-                triangle_is_completely_inner = False
-        if triangle_is_completely_inner:
-            quasiperimeter = max_perimeter(a,b,c)
-            centroid = triangle_centroid(a, b, c)
-            if point_in_polygon(centroid, input_points) == "inner":
-                interpolant = interpolate_points(b, centroid, tempo/sqrt(quasiperimeter))
-                result.append(interpolant)
-            else:
-                result.append(b)
-        else:
-            result.append(b)
-
-    return result
+    return [tuple(p) for p in jam_points(input_points, tempo, inward=True)]
 
 def generate_points_from_polygon_out(input_points, tempo=1):
     """
@@ -73,30 +321,4 @@ def generate_points_from_polygon_out(input_points, tempo=1):
     Returns:
         List of (x, y) tuples of generated points.
     """
-    n = len(input_points)
-    if n < 3:
-        raise ValueError("Polygon must have at least 3 vertices to form triangles.")
-
-    result = []
-    for i in range(n):
-        a = input_points[(i - 1) % n]
-        b = input_points[(i + 0) % n]
-        c = input_points[(i + 1) % n]
-
-        triangle_is_completely_outer = True
-        for j, other_points in enumerate(input_points):
-            if j == (i - 1) % n or j == i or j == (i + 1) % n:
-                continue
-            if point_in_polygon(input_points[j], [a, b, c]) == "inner":
-                triangle_is_completely_outer = False
-        if triangle_is_completely_outer:
-            quasiperimeter = max_perimeter(a,b,c)
-            centroid = triangle_centroid(a, b, c)
-            if point_in_polygon(centroid, input_points) == "outer":
-                interpolant = interpolate_points(b, centroid, tempo/sqrt(quasiperimeter))
-                result.append(interpolant)
-            else:
-                result.append(b)
-        else:
-            result.append(b)
-    return result
+    return [tuple(p) for p in jam_points(input_points, tempo, inward=False)]
@@ -1,3 +1,5 @@
+import numpy as np
+
 def order_edges(edges_set):
     """
     Given a set of integer pairs (edges), returns an ordered list of tuples such that:
@@ -71,3 +73,44 @@ def order_edges(edges_set):
         raise ValueError("Input edges cannot be arranged into a proper chain; edges unused.")
 
     return path
+
+def order_cycle(edges, points):
+    """
+    Fast path of order_edges for edges forming a single cycle.
+
+    Builds a degree-2 adjacency table in NumPy and walks the cycle once.
+
+    Args:
+        edges: set of tuples (int, int) or integer array of shape (m, 2).
+        points: array of shape (N, 2) with coordinates of all points.
+
+    Returns:
+        Tuple (ordered vertices as contiguous float64 array of shape (n, 2),
+        integer array of shape (n,) with their indices into points).
+
+    Raises:
+        ValueError: if edges do not form exactly one cycle.
+    """
+    edges = np.asarray(list(edges) if isinstance(edges, (set, frozenset)) else edges, dtype=np.int64)
+    if len(edges) < 3:
+        raise ValueError("Input edges cannot be arranged into a cycle.")
+    ends = np.concatenate([edges[:, 0], edges[:, 1]])
+    others = np.concatenate([edges[:, 1], edges[:, 0]])
+    vertices, ranks, degree = np.unique(ends, return_inverse=True, return_counts=True)
+    if np.any(degree != 2):
+        raise ValueError("Input edges cannot be arranged into a cycle; vertex degrees differ from 2.")
+    # Row r holds both neighbours of the vertex of rank r
+    neighbours = np.searchsorted(vertices, others[np.argsort(ranks, kind="stable")]).reshape(-1, 2).tolist()
+
+    n = len(vertices)
+    order = [0]
+    previous, current = -1, 0
+    for _ in range(n - 1):
+        first, second = neighbours[current]
+        previous, current = current, (second if first == previous else first)
+        order.append(current)
+    if len(set(order)) != n:
+        raise ValueError("Input edges cannot be arranged into a single cycle.")
+
+    permutation = vertices[order]
+    return np.ascontiguousarray(np.asarray(points, dtype=np.float64)[permutation]), permutation
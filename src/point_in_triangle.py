@@ -1,10 +1,5 @@
+from src.geometry_backends import kernel
+
 def point_in_triangle(pt, v1, v2, v3):
     """Check if point pt lies inside triangle (v1,v2,v3) using barycentric technique."""
-    def sign(p1, p2, p3):
-        return (p1[0] - p3[0])*(p2[1] - p3[1]) - (p2[0] - p3[0])*(p1[1] - p3[1])
-
-    b1 = sign(pt, v1, v2) < 0.0
-    b2 = sign(pt, v2, v3) < 0.0
-    b3 = sign(pt, v3, v1) < 0.0
-
-    return ((b1 == b2) and (b2 == b3))
+    return kernel("point_in_triangle")(pt, v1, v2, v3)
@@ -1,15 +1,5 @@
-import numpy as np
+from src.geometry_backends import kernel
 
 def point_on_segment(p, a, b, eps=1e-9):
     """Check if point p lies on segment a-b (colinear and between)."""
-    ap = np.subtract(np.asarray(p),np.asarray(a))
-    ab = np.subtract(np.asarray(b),np.asarray(a))
-    cross = np.cross(ab, ap)
-    if abs(cross) > eps:
-        return False
-    dot = np.dot(ap, ab)
-    if dot < 0:
-        return False
-    if dot > np.dot(ab, ab):
-        return False
-    return True
+    return kernel("point_on_segment")(p, a, b, eps)
@@ -0,0 +1,102 @@
+import numpy as np
+
+from src.polygon_area import polygon_area
+
+
+class Polygon:
+    """
+    Polygon vertices in one contiguous float64 buffer of shape (n, 2).
+
+    Derived quantities (bounding box, edge vectors, signed area and winding) are
+    computed on first use and cached until the vertices are written through
+    __setitem__ or move_vertices. The buffer itself is only handed out read-only,
+    so the caches cannot go stale behind the polygon's back, unless an array was
+    handed over with copy=False and its former owner writes to it later; call
+    invalidate() after such a write.
+
+    A Polygon converts to an array without copying (np.asarray(polygon)), so
+    everything accepting vertex arrays accepts a Polygon as well.
+    """
+
+    __slots__ = ("_buffer", "_bbox", "_edge_vectors", "_area")
+
+    def __init__(self, vertices, copy=True):
+        """
+        Args:
+            vertices: array of shape (n, 2), list of tuples or another Polygon, in order.
+            copy: if False and vertices already is a contiguous float64 array, take it over as
+                the buffer instead of copying; the caller should not write to it anymore,
+                or must call invalidate() afterwards.
+        """
+        buffer = np.array(vertices, dtype=np.float64, copy=copy or None, order="C")
+        if buffer.ndim != 2 or buffer.shape[1] != 2:
+            raise ValueError("Polygon vertices must have shape (n, 2).")
+        self._buffer = buffer
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop cached derived quantities, needed only after writing to a buffer taken over with copy=False."""
+        self._bbox = None
+        self._edge_vectors = None
+        self._area = None
+
+    @property
+    def vertices(self):
+        """Read-only view of the vertex buffer."""
+        view = self._buffer.view()
+        view.flags.writeable = False
+        return view
+
+    def __array__(self, dtype=None, copy=None):
+        if copy or (dtype is not None and np.dtype(dtype) != self._buffer.dtype):
+            return np.array(self._buffer, dtype=dtype)
+        return self.vertices
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def __getitem__(self, index):
+        return self.vertices[index]
+
+    def __setitem__(self, index, value):
+        self._buffer[index] = value
+        self.invalidate()
+
+    def __repr__(self):
+        return f"Polygon({len(self)} vertices)"
+
+    def copy(self):
+        return Polygon(self._buffer)
+
+    def move_vertices(self, indices, positions):
+        """Set vertices at indices to positions of shape (k, 2)."""
+        self[np.asarray(indices, dtype=np.int64)] = positions
+
+    @property
+    def bbox(self):
+        """Tuple (lower, upper) of corner arrays of the bounding box."""
+        if self._bbox is None:
+            lower, upper = self._buffer.min(axis=0), self._buffer.max(axis=0)
+            lower.flags.writeable = upper.flags.writeable = False
+            self._bbox = lower, upper
+        return self._bbox
+
+    @property
+    def edge_vectors(self):
+        """Array of shape (n, 2), row i is the vector from vertex i to vertex i+1."""
+        if self._edge_vectors is None:
+            self._edge_vectors = np.roll(self._buffer, -1, axis=0) - self._buffer
+            self._edge_vectors.flags.writeable = False
+        return self._edge_vectors
+
+    @property
+    def area(self):
+        """Signed area, positive for counterclockwise order (see polygon_area)."""
+        if self._area is None:
+            self._area = polygon_area(self._buffer)
+        return self._area
+
+    @property
+    def winding(self):
+        """1 for counterclockwise, -1 for clockwise, 0 for degenerate polygons."""
+        return int(np.sign(self.area))
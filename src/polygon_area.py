@@ -0,0 +1,7 @@
+import numpy as np
+
+def polygon_area(vertices):
+    """Signed area of a polygon by the shoelace formula, positive for counterclockwise order."""
+    v = np.asarray(vertices, dtype=np.float64)
+    x, y = v[:, 0], v[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
@@ -0,0 +1,107 @@
+import hashlib
+import os
+
+import numpy as np
+
+from src import constant_parameters
+
+
+class Triangulation:
+    """Delaunay simplices of a polygon loaded from the cache, in place of the scipy object."""
+
+    __slots__ = ("points", "simplices")
+
+    def __init__(self, points, simplices):
+        self.points = points
+        self.simplices = simplices
+
+
+class PolygonCache:
+    """
+    On-disk cache of generated polygons.
+
+    Every entry is one .npz file with the input points, the Delaunay simplices and
+    the order of polygon vertices, so a hit skips triangulation and polygon
+    construction entirely. Entries are keyed by (seed, number of points, resolution)
+    for seeded polygons, or by a hash of the input points otherwise.
+
+    Reading an entry refreshes its modification time; storing one evicts the least
+    recently used entries beyond max_entries or max_bytes. Files are written under
+    a temporary name and renamed, so several processes can share one directory.
+    """
+
+    def __init__(self, directory=constant_parameters.POLYGON_CACHE_DIR,
+                 max_entries=constant_parameters.POLYGON_CACHE_MAX_ENTRIES,
+                 max_bytes=constant_parameters.POLYGON_CACHE_MAX_BYTES):
+        """
+        Args:
+            directory: cache directory, created if missing.
+            max_entries: largest number of cached polygons.
+            max_bytes: largest total size of cached files.
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def seed_key(seed, num_points, resolution):
+        return f"seed-{seed}-{num_points}-{resolution[0]}x{resolution[1]}"
+
+    @staticmethod
+    def points_key(points):
+        points = np.ascontiguousarray(points, dtype=np.float64)
+        return "points-" + hashlib.sha1(points.tobytes()).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + ".npz")
+
+    def load(self, key):
+        """
+        Return cached (points, simplices, order) of key, or None on a miss.
+        """
+        path = self.path(key)
+        try:
+            with np.load(path) as entry:
+                result = entry["points"], entry["simplices"], entry["order"]
+            os.utime(path)
+        except (OSError, KeyError, ValueError):
+            return None
+        return result
+
+    def store(self, key, points, simplices, order):
+        path = self.path(key)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as f:
+            np.savez(f, points=points, simplices=simplices, order=order)
+        os.replace(temporary, path)
+        self.evict()
+
+    def entries(self):
+        """Return list of (modification time, size, path) of cached files, oldest first."""
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npz"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                found.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(found)
+
+    def evict(self):
+        """Remove least recently used entries until both limits hold."""
+        entries = self.entries()
+        count, total = len(entries), sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            count, total = count - 1, total - size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            os.remove(path)
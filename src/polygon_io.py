@@ -0,0 +1,225 @@
+"""
+Reading and writing polygons and trajectories as CSV, WKT, GeoJSON and .npy.
+
+Text formats are parsed with np.fromstring over whole blocks of text, never
+point by point: CSV files are streamed in chunks of complete lines, and the
+first ring of a WKT or GeoJSON file is cut out of the text and parsed at once.
+The format is chosen by the file extension:
+
+    .npy                 array of shape (n, 2)
+    .csv, .txt           x,y (or whitespace separated) rows, an optional header line
+    .wkt                 POLYGON ((x y, x y, ...)), the exterior ring is used
+    .geojson, .json      Polygon, MultiPolygon, LineString, Feature or FeatureCollection,
+                         the first ring is used
+
+Positions with z or m coordinates (x,y,z rows, POLYGON Z, [x, y, z]) keep x and y;
+the number of coordinates per position is taken from the first one.
+"""
+import io
+import json
+import re
+
+import numpy as np
+
+from src.generate_points_and_polygon import generate_points_and_polygon
+from src.is_simple_polygon import is_simple_polygon
+from src.trajectory import TrajectoryReader
+
+CHUNK_SIZE = 1 << 24
+
+# Characters separating numbers in the supported text formats
+_SEPARATORS = str.maketrans(",;()[]\t\r\n", "         ")
+_HEADER = re.compile(r"[a-df-zA-DF-Z_]")
+_GEOJSON_RING = re.compile(r"\[\s*\[\s*[-+.\d]")
+_GEOJSON_RING_END = re.compile(r"\]\s*\]")
+
+
+def _format(path):
+    extension = path.lower().rsplit(".", 1)[-1]
+    formats = {"npy": "npy", "csv": "csv", "txt": "csv", "wkt": "wkt", "geojson": "geojson", "json": "geojson"}
+    if extension not in formats:
+        raise ValueError(f"Unknown polygon file format of {path}, expected one of .{', .'.join(formats)}.")
+    return formats[extension]
+
+
+def _numbers(text):
+    return np.fromstring(text.translate(_SEPARATORS), sep=" ")
+
+
+def _dimensions(position, path):
+    """Number of coordinates of a position given as text, 2 (x y) to 4 (x y z m)."""
+    dimensions = len(_numbers(position))
+    if not 2 <= dimensions <= 4:
+        raise ValueError(f"Positions of {dimensions} coordinates in {path}, expected 2 to 4.")
+    return dimensions
+
+
+def _ring(values, path, dimensions=2):
+    """Reshape parsed numbers into an (n, 2) ring of x,y, dropping a closing vertex."""
+    if len(values) % dimensions:
+        raise ValueError(f"Number of coordinates in {path} is not a multiple of {dimensions} per position.")
+    ring = values.reshape(-1, dimensions)[:, :2]
+    if len(ring) > 1 and np.array_equal(ring[0], ring[-1]):
+        ring = ring[:-1]
+    return np.ascontiguousarray(ring)
+
+
+def read_csv(path, chunk_size=CHUNK_SIZE):
+    """Stream x,y rows into one array, reading chunk_size characters of complete lines at a time."""
+    parts = []
+    with open(path) as f:
+        first = f.readline()
+        if _HEADER.search(first):
+            first = f.readline()
+        dimensions = _dimensions(first, path)
+        parts.append(_numbers(first))
+        carry = ""
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            text = carry + chunk
+            cut = text.rfind("\n") + 1
+            carry = text[cut:]
+            parts.append(_numbers(text[:cut]))
+        parts.append(_numbers(carry))
+    return _ring(np.concatenate(parts), path, dimensions)
+
+
+def read_wkt(path):
+    with open(path) as f:
+        text = f.read()
+    start = text.find("((")
+    if start < 0:
+        raise ValueError(f"No POLYGON ring found in {path}.")
+    end = text.find(")", start + 2)
+    ring = text[start + 2:end if end >= 0 else len(text)]
+    return _ring(_numbers(ring), path, _dimensions(ring.split(",", 1)[0], path))
+
+
+def read_geojson(path):
+    with open(path) as f:
+        text = f.read()
+    coordinates = text.find('"coordinates"')
+    start = _GEOJSON_RING.search(text, max(coordinates, 0)) if coordinates >= 0 else None
+    if start is None:
+        raise ValueError(f"No coordinates found in {path}.")
+    end = _GEOJSON_RING_END.search(text, start.start())
+    ring = text[start.start():end.end() if end else len(text)]
+    first = ring[ring.index("[", 1) + 1:]
+    return _ring(_numbers(ring), path, _dimensions(first[:first.find("]")], path))
+
+
+def read_vertices(path):
+    """
+    Read vertices of the first ring in a file, as they are stored.
+
+    Returns:
+        Contiguous float64 array of shape (n, 2), without a repeated closing vertex.
+    """
+    kind = _format(path)
+    if kind == "npy":
+        array = np.load(path)
+        if array.ndim != 2 or not 2 <= array.shape[1] <= 4:
+            raise ValueError(f"Array of shape {array.shape} in {path}, expected (n, 2) to (n, 4).")
+        return _ring(array.astype(np.float64, copy=False).ravel(), path, array.shape[1])
+    return {"csv": read_csv, "wkt": read_wkt, "geojson": read_geojson}[kind](path)
+
+
+def load_polygon(path):
+    """
+    Load a polygon to jam.
+
+    A ring which already is a simple polygon in order is used as is, skipping
+    triangulation; otherwise its vertices are treated as a point cloud and a
+    polygon is built over them with generate_points_and_polygon.
+
+    Returns:
+        Tuple (array of shape (n, 2) with vertices in order, True if a polygon was built).
+    """
+    vertices = read_vertices(path)
+    if is_simple_polygon(vertices):
+        return vertices, False
+    return generate_points_and_polygon(vertices)[3], True
+
+
+def _text_ring(vertices, pattern, separator, closed):
+    vertices = np.asarray(vertices, dtype=np.float64)
+    if closed:
+        vertices = np.concatenate([vertices, vertices[:1]])
+    buffer = io.StringIO()
+    np.savetxt(buffer, vertices, fmt=pattern, newline=separator)
+    return buffer.getvalue()[:-len(separator)]
+
+
+def wkt_polygon(vertices):
+    return "POLYGON ((" + _text_ring(vertices, "%.17g %.17g", ", ", closed=True) + "))"
+
+
+def geojson_feature(vertices, properties=None):
+    ring = _text_ring(vertices, "[%.17g,%.17g]", ",", closed=True)
+    return ('{"type":"Feature","properties":' + json.dumps(properties or {})
+            + ',"geometry":{"type":"Polygon","coordinates":[[' + ring + "]]}}")
+
+
+def save_polygon(path, vertices):
+    """Write polygon vertices in the format given by the extension of path."""
+    kind = _format(path)
+    vertices = np.asarray(vertices, dtype=np.float64)
+    if kind == "npy":
+        np.save(path, vertices)
+        return
+    with open(path, "w") as f:
+        if kind == "csv":
+            f.write("x,y\n")
+            np.savetxt(f, vertices, fmt="%.17g", delimiter=",")
+        elif kind == "wkt":
+            f.write(wkt_polygon(vertices) + "\n")
+        else:
+            f.write(geojson_feature(vertices) + "\n")
+
+
+def export_trajectory(trajectory_path, path, every=1):
+    """
+    Export frames of a recorded trajectory (see TrajectoryWriter).
+
+    CSV gets iteration,x,y rows, WKT one POLYGON per line, GeoJSON a
+    FeatureCollection with the iteration as a property, and .npy an array of
+    shape (frames, n, 2), which needs the same vertex count in every frame.
+
+    Args:
+        trajectory_path: recorded trajectory.
+        path: output file, its extension selects the format.
+        every: export every this many frames.
+    """
+    reader = TrajectoryReader(trajectory_path)
+    frames = range(0, len(reader), every)
+    kind = _format(path)
+    if kind == "npy":
+        counts = reader.vertex_counts()[frames]
+        if len(set(counts.tolist())) > 1:
+            raise ValueError("Vertex count changes between frames, use CSV, WKT or GeoJSON.")
+        # Written frame by frame through a memory map, the history is never held in memory
+        output = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64,
+                                           shape=(len(frames), int(counts[0]) if len(frames) else 0, 2))
+        for k, i in enumerate(frames):
+            output[k] = reader[i]
+        output.flush()
+        del output
+        return
+    with open(path, "w") as f:
+        if kind == "csv":
+            f.write("iteration,x,y\n")
+        elif kind == "geojson":
+            f.write('{"type":"FeatureCollection","features":[\n')
+        for k, i in enumerate(frames):
+            frame = reader[i]
+            if kind == "csv":
+                np.savetxt(f, np.column_stack([np.full(len(frame), reader.iteration(i)), frame]),
+                           fmt=("%d", "%.17g", "%.17g"), delimiter=",")
+            elif kind == "wkt":
+                f.write(wkt_polygon(frame) + "\n")
+            else:
+                f.write(("," if k else "") + geojson_feature(frame, {"iteration": reader.iteration(i)}) + "\n")
+        if kind == "geojson":
+            f.write("]}\n")
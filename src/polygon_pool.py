@@ -0,0 +1,93 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from src import constant_parameters
+from src.generate_points_and_polygon import generate_points_and_polygon
+from src.polygon_cache import Triangulation
+
+# Retry k of seed s draws its points from seed s + k * RETRY_SEED_STRIDE
+RETRY_SEED_STRIDE = 2**32
+
+
+def generate_polygon(seed, num_points=constant_parameters.NUM_POINTS, resolution=constant_parameters.RESOLUTION,
+                     cache=None, retries=constant_parameters.POLYGON_RETRIES):
+    """
+    Build a polygon from a seed, retrying with fresh points when construction fails.
+
+    Returns:
+        Tuple (seed actually used, points, edges, triangulation, ordered vertices),
+        see generate_points_and_polygon; the triangulation only carries simplices.
+
+    Raises:
+        ValueError: if all retries fail.
+    """
+    for attempt in range(retries + 1):
+        used = seed + attempt * RETRY_SEED_STRIDE
+        try:
+            points, edges, triangulation, ordered_vertices = generate_points_and_polygon(
+                seed=used, num_points=num_points, resolution=resolution, cache=cache)
+        except ValueError as error:
+            failure = error
+            continue
+        return used, points, edges, Triangulation(points, triangulation.simplices), ordered_vertices
+    raise ValueError(f"Polygon construction from seed {seed} failed {retries + 1} times: {failure}")
+
+
+class PolygonPool:
+    """
+    Polygons generated ahead of time by background processes.
+
+    Seeds start at first_seed and increase by one. Up to size polygons are
+    being generated or wait ready in a queue; taking one submits the next seed,
+    so regeneration in the UI never waits for construction once the queue is full.
+    Worker processes keep construction from competing with the render loop for the GIL.
+    """
+
+    def __init__(self, first_seed, size=constant_parameters.POLYGON_POOL_SIZE,
+                 workers=constant_parameters.POLYGON_POOL_WORKERS, num_points=constant_parameters.NUM_POINTS,
+                 resolution=constant_parameters.RESOLUTION, cache=None):
+        """
+        Args:
+            first_seed: seed of the first pooled polygon.
+            size: bound of the queue of pending and ready polygons.
+            workers: number of worker processes.
+            num_points, resolution, cache: see generate_points_and_polygon.
+        """
+        self.next_seed = first_seed
+        self.options = dict(num_points=num_points, resolution=resolution, cache=cache)
+        # Fresh interpreters, the parent may hold SDL state and running threads
+        self.executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        self.queue = deque()
+        for _ in range(size):
+            self.submit()
+
+    def submit(self):
+        self.queue.append(self.executor.submit(generate_polygon, self.next_seed, **self.options))
+        self.next_seed += 1
+
+    def ready(self):
+        """True if the next polygon can be taken without waiting."""
+        return bool(self.queue) and self.queue[0].done()
+
+    def get(self, block=True):
+        """
+        Take the next polygon in seed order and queue generation of another one.
+
+        Args:
+            block: wait for the next polygon if it is not ready yet; otherwise return None.
+
+        Returns:
+            Result of generate_polygon, or None.
+
+        Raises:
+            ValueError: if the polygon could not be built even with retries.
+        """
+        if not block and not self.ready():
+            return None
+        future = self.queue.popleft()
+        self.submit()
+        return future.result()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
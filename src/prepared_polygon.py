@@ -0,0 +1,168 @@
+import numpy as np
+
+from src.check_belonging_to_polygon import on_segments, ray_crossings, on_segment, ray_crossing, OUTER, INNER, EDGE, VERTEX, POSITION_NAMES
+
+
+class PreparedPolygon:
+    """
+    Polygon prepared for repeated point location queries.
+
+    Edges are bucketed into horizontal slabs of equal height: edge i (from vertex i
+    to vertex i+1) is registered in every slab its y-range (widened by epsilon) overlaps.
+    A query then only tests the edges of its own slab, after a bounding box prefilter,
+    and gives the same answers as point_position_with_respect_to_polygon.
+
+    Moving vertices only recomputes the slab ranges of their two edges. Moved edges
+    are tested by every query on top of the edges of its slab, until there are more
+    than about sqrt(n) of them; only then the slab table is re-derived, in one
+    vectorized pass, by the next query. Moving vertices one at a time between
+    single queries (the Gauss-Seidel schedule) thus costs O(sqrt(n)) per move.
+    """
+
+    def __init__(self, polygon, epsilon=1e-12, slab_count=None):
+        """
+        Args:
+            polygon: array of shape (n, 2) or list of tuples with polygon vertices.
+            epsilon: numerical tolerance for closeness checks.
+            slab_count: number of slabs; defaults to the number of vertices.
+        """
+        self.vertices = np.array(polygon, dtype=np.float64)
+        self.epsilon = epsilon
+        n = len(self.vertices)
+        self.slab_count = slab_count or n
+        self.y0 = self.vertices[:, 1].min()
+        height = self.vertices[:, 1].max() - self.y0
+        self.slab_height = height / self.slab_count if height > 0 else 1.0
+        self.edge_lo = np.empty(n, dtype=np.int64)
+        self.edge_hi = np.empty(n, dtype=np.int64)
+        self.dirty_limit = max(16, int(np.sqrt(n)))
+        self.slab_edges = None
+        self.update_edges(np.arange(n))
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def slab_of(self, y):
+        """Return slab indices of y coordinates, clipped to the slab range."""
+        return np.clip(np.floor((y - self.y0) / self.slab_height), 0, self.slab_count - 1).astype(np.int64)
+
+    def update_edges(self, edge_indices):
+        """Recompute slab ranges of given edges and mark them dirty, or the slab table stale if too many are."""
+        n = len(self.vertices)
+        y1 = self.vertices[edge_indices, 1]
+        y2 = self.vertices[(edge_indices + 1) % n, 1]
+        self.edge_lo[edge_indices] = self.slab_of(np.minimum(y1, y2) - self.epsilon)
+        self.edge_hi[edge_indices] = self.slab_of(np.maximum(y1, y2) + self.epsilon)
+        if self.slab_edges is None:
+            return
+        self.dirty[edge_indices] = True
+        self.dirty_edges = np.flatnonzero(self.dirty)
+        if len(self.dirty_edges) > self.dirty_limit:
+            self.slab_edges = None
+
+    def move_vertices(self, indices, positions):
+        """
+        Move some vertices, updating only the two edges adjacent to each of them.
+
+        Args:
+            indices: integer array of moved vertex indices.
+            positions: array of shape (k, 2) with their new coordinates.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if len(indices) == 0:
+            return
+        self.vertices[indices] = positions
+        if self.slab_edges is not None:
+            # The bounding box prefilter may only grow until the next rebuild
+            self.lower = np.minimum(self.lower, self.vertices[indices].min(axis=0) - self.epsilon)
+            self.upper = np.maximum(self.upper, self.vertices[indices].max(axis=0) + self.epsilon)
+        n = len(self.vertices)
+        self.update_edges(np.unique(np.concatenate([indices, (indices - 1) % n])))
+
+    def build_slabs(self):
+        """Derive CSR-like slab table (offsets into edge list sorted by slab) and the bbox."""
+        spans = self.edge_hi - self.edge_lo + 1
+        edges = np.repeat(np.arange(len(self.vertices)), spans)
+        starts = np.repeat(np.cumsum(spans) - spans, spans)
+        slabs = np.repeat(self.edge_lo, spans) + np.arange(len(edges)) - starts
+        order = np.argsort(slabs, kind="stable")
+        self.slab_edges = edges[order]
+        self.slab_offsets = np.concatenate([[0], np.cumsum(np.bincount(slabs, minlength=self.slab_count))])
+        self.lower = self.vertices.min(axis=0) - self.epsilon
+        self.upper = self.vertices.max(axis=0) + self.epsilon
+        self.dirty = np.zeros(len(self.vertices), dtype=bool)
+        self.dirty_edges = np.zeros(0, dtype=np.int64)
+
+    def classify(self, points):
+        """
+        Classify query points against the polygon.
+
+        Args:
+            points: array of shape (m, 2) with query points.
+
+        Returns:
+            int8 array of shape (m,) with codes OUTER, INNER, EDGE or VERTEX.
+        """
+        if self.slab_edges is None:
+            self.build_slabs()
+        queries = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        m, n = len(queries), len(self.vertices)
+        codes = np.full(m, OUTER, dtype=np.int8)
+        in_box = np.flatnonzero(np.all((queries >= self.lower) & (queries <= self.upper), axis=1))
+        if len(in_box) == 0:
+            return codes
+
+        slabs = self.slab_of(queries[in_box, 1])
+        counts = self.slab_offsets[slabs + 1] - self.slab_offsets[slabs]
+        owners = np.repeat(np.arange(len(in_box)), counts)
+        within = np.arange(len(owners)) - np.repeat(np.cumsum(counts) - counts, counts)
+        edges = self.slab_edges[np.repeat(self.slab_offsets[slabs], counts) + within]
+        if len(self.dirty_edges):
+            # Moved edges may be missing from (or stale in) the table, test them for every query
+            clean = ~self.dirty[edges]
+            owners = np.concatenate([owners[clean], np.repeat(np.arange(len(in_box)), len(self.dirty_edges))])
+            edges = np.concatenate([edges[clean], np.tile(self.dirty_edges, len(in_box))])
+
+        eps = self.epsilon
+        x, y = queries[in_box[owners], 0], queries[in_box[owners], 1]
+        vx, vy = self.vertices[edges, 0], self.vertices[edges, 1]
+        nx, ny = self.vertices[(edges + 1) % n, 0], self.vertices[(edges + 1) % n, 1]
+        on_vertex = (np.abs(x - vx) <= eps) & (np.abs(y - vy) <= eps)
+        on_edge = on_segments(x, y, vx, vy, nx, ny, eps)
+        crossing = ray_crossings(x, y, nx, ny, vx, vy, eps)
+
+        k = len(in_box)
+        local = np.full(k, OUTER, dtype=np.int8)
+        local[np.bincount(owners[crossing], minlength=k) % 2 == 1] = INNER
+        local[np.bincount(owners[on_edge], minlength=k) > 0] = EDGE
+        local[np.bincount(owners[on_vertex], minlength=k) > 0] = VERTEX
+        codes[in_box] = local
+        return codes
+
+    def classify_point(self, x, y):
+        """
+        Scalar classify of one point given as Python floats, for one-at-a-time queries
+        between single vertex moves, where the array overhead of classify dominates.
+        """
+        if self.slab_edges is None:
+            self.build_slabs()
+        eps = self.epsilon
+        if not (self.lower[0] <= x <= self.upper[0] and self.lower[1] <= y <= self.upper[1]):
+            return OUTER
+        slab = min(max(int(np.floor((y - self.y0) / self.slab_height)), 0), self.slab_count - 1)
+        edges = self.slab_edges[self.slab_offsets[slab]:self.slab_offsets[slab + 1]]
+        if len(self.dirty_edges):
+            edges = np.concatenate([edges[~self.dirty[edges]], self.dirty_edges])
+        n = len(self.vertices)
+        starts = self.vertices[edges].tolist()
+        ends = self.vertices[(edges + 1) % n].tolist()
+        on_vertex = on_edge = inside = False
+        for (vx, vy), (nx, ny) in zip(starts, ends):
+            on_vertex = on_vertex or (abs(x - vx) <= eps and abs(y - vy) <= eps)
+            on_edge = on_edge or on_segment(x, y, vx, vy, nx, ny, eps)
+            inside ^= ray_crossing(x, y, nx, ny, vx, vy, eps)
+        return VERTEX if on_vertex else EDGE if on_edge else INNER if inside else OUTER
+
+    def position(self, point):
+        """Single point query, returns one of {"outer", "inner", "edge", "vertex"}."""
+        return POSITION_NAMES[self.classify([point])[0]]
@@ -0,0 +1,116 @@
+import numpy as np
+
+from src.jammer import triplets, empty_triangles
+from src.polygon_area import polygon_area
+from src.segment_grid import SegmentGrid
+
+
+def decimation_candidates(points, collinear_tolerance, min_spacing, max_edge, inward=None):
+    """
+    Vertices worth removing: nearly collinear with their neighbours, or closer than
+    min_spacing to one of them, provided the chord replacing their two edges is
+    not longer than max_edge (otherwise refinement would split it again).
+
+    Removing a convex vertex cuts its triangle off the polygon, removing a reflex
+    one adds it. With inward True only convex (or collinear) vertices are candidates,
+    so the new polygon lies inside the old one; with inward False only reflex ones.
+
+    Collinearity is the scale-free form of orientation_type's "collinear":
+    the height of the vertex above the chord is at most collinear_tolerance
+    times the chord length.
+
+    Returns:
+        Tuple (candidate indices sorted by relative height, relative heights of all vertices).
+    """
+    a, b, c = triplets(points)
+    chord = c - a
+    chord_length = np.hypot(chord[:, 0], chord[:, 1])
+    turn = (b - a)[:, 0] * chord[:, 1] - (b - a)[:, 1] * chord[:, 0]
+    cross = np.abs(turn)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        height = cross / chord_length**2
+    spacing = np.minimum(np.hypot(*(b - a).T), np.hypot(*(c - b).T))
+    wanted = (height <= collinear_tolerance) | (spacing < min_spacing)
+    wanted &= (chord_length > 0) & (chord_length <= max_edge)
+    if inward is not None:
+        # Positive for vertices turning the same way as the polygon winds, i.e. convex ones
+        convexity = turn * np.sign(polygon_area(points))
+        wanted &= convexity >= 0 if inward else convexity <= 0
+    candidates = np.flatnonzero(wanted)
+    return candidates[np.argsort(height[candidates], kind="stable")], height
+
+
+def decimate(points, collinear_tolerance, min_spacing, max_edge, min_vertices=3, inward=None):
+    """
+    Remove vertices picked by decimation_candidates while keeping the polygon simple.
+
+    A vertex is removed only if its triplet triangle contains no other vertex and the
+    chord between its neighbours crosses no edge (checked with SegmentGrid by moving
+    the vertex onto the chord). Neighbours of a removed vertex are kept in the same pass.
+    inward restricts removals to convex or reflex vertices, see decimation_candidates.
+
+    Returns:
+        Tuple (array of remaining vertices in order, number of removed vertices).
+    """
+    n = len(points)
+    candidates, _ = decimation_candidates(points, collinear_tolerance, min_spacing, max_edge, inward)
+    if len(candidates) == 0 or n <= min_vertices:
+        return points, 0
+    candidates = candidates[empty_triangles(points, np.sort(candidates))[candidates]]
+    grid = SegmentGrid(points)
+    removed = np.zeros(n, dtype=bool)
+    count = 0
+    for i in candidates:
+        if n - count <= min_vertices:
+            break
+        if removed[(i - 1) % n] or removed[(i + 1) % n]:
+            continue
+        midpoint = (grid.points[(i - 1) % n] + grid.points[(i + 1) % n]) / 2
+        if grid.move_is_safe(i, midpoint):
+            grid.move_vertex(i, midpoint)
+            removed[i] = True
+            count += 1
+    return points[~removed], count
+
+
+def refine(points, max_edge):
+    """
+    Split every edge longer than max_edge into equal pieces no longer than max_edge.
+    Inserted vertices lie on the original edges, so the polygon stays simple.
+
+    Returns:
+        Tuple (array of vertices in order, number of inserted vertices).
+    """
+    edges = np.roll(points, -1, axis=0) - points
+    pieces = np.maximum(1, np.ceil(np.hypot(edges[:, 0], edges[:, 1]) / max_edge)).astype(np.int64)
+    if pieces.max() == 1:
+        return points, 0
+    owner = np.repeat(np.arange(len(points)), pieces)
+    step = np.arange(len(owner)) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+    t = (step / pieces[owner])[:, None]
+    return points[owner] + t * edges[owner], int(len(owner) - len(points))
+
+
+def remesh(points, collinear_tolerance, min_spacing, max_edge, min_vertices=3, inward=None):
+    """
+    Decimate nearly collinear or crowded vertices, then split over-long edges.
+
+    Args:
+        points: array of shape (n, 2) with polygon vertices in order.
+        collinear_tolerance: largest height of a removable vertex above the chord
+            of its neighbours, relative to the chord length.
+        min_spacing: vertices closer than this to a neighbour are removable.
+        max_edge: edges longer than this are split; chords longer than this are never created.
+        min_vertices: decimation never leaves fewer vertices than this.
+        inward: when jamming in (True) the result lies inside the polygon, when expanding
+            (False) it contains it; None allows removing any vertex.
+
+    Returns:
+        Tuple (array of shape (m, 2) with new vertices, number removed, number inserted).
+    """
+    if not min_spacing < max_edge / 2:
+        raise ValueError("min_spacing must be less than half of max_edge, otherwise remeshing oscillates.")
+    points = np.asarray(points, dtype=np.float64)
+    points, removed = decimate(points, collinear_tolerance, min_spacing, max_edge, min_vertices, inward)
+    points, inserted = refine(points, max_edge)
+    return points, removed, inserted
@@ -0,0 +1,118 @@
+import numpy as np
+import pygame as pg
+
+from src import constant_parameters
+from src.polygon import Polygon
+
+
+class PolygonRenderer:
+    """
+    Draws the triangulation, the polygon and its vertices on the pygame screen.
+
+    The triangulation never changes for a polygon, so it is drawn once into an
+    off-screen layer, a few thousand edges per frame (see draw_triangulation) so that
+    switching to a large polygon never stalls the render loop; the layer is blended
+    under the trails and brought back whenever the screen is cleared. The polygon is drawn with a single aalines call,
+    vertices are stamped directly into the pixel array, and only the rectangles
+    touched since the last frame are pushed to the display.
+
+    Trails of previous frames stay on screen. Drawing colors are raised to the
+    background color channel by channel beforehand, which gives the same pixels
+    as the former full-screen BLEND_RGBA_MAX fill after every frame.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.triangulation_edges = np.zeros((0, 2, 2))
+        self.triangulation_layer = pg.Surface(screen.get_size())
+        self.triangulation_layer.fill(constant_parameters.BACKGROUND_COLOR)
+        self.dirty = []
+        self.full_update = True
+        background = np.array(constant_parameters.BACKGROUND_COLOR[:3])
+        self.edge_color = tuple(np.maximum(constant_parameters.EDGE_COLOR, background).tolist())
+        self.background = background.astype(np.uint8)
+
+    def reset(self, points=None, simplices=None):
+        """
+        Clear the trails from the screen, keeping the triangulation drawn so far.
+        If simplices of a new polygon are given, its triangulation replaces the
+        current one and is queued for draw_triangulation.
+        """
+        self.screen.fill(constant_parameters.BACKGROUND_COLOR)
+        if simplices is not None:
+            self.triangulation_layer.fill(constant_parameters.BACKGROUND_COLOR)
+            points = np.asarray(points, dtype=np.float64)
+            edges = np.concatenate([simplices[:, [0, 1]], simplices[:, [1, 2]], simplices[:, [2, 0]]])
+            edges = np.sort(edges, axis=1).astype(np.int64)
+            # Unique edges through scalar keys, much faster than np.unique over rows
+            keys = np.unique(edges[:, 0] * len(points) + edges[:, 1])
+            self.triangulation_edges = points[np.column_stack([keys // len(points), keys % len(points)])]
+        else:
+            self.screen.blit(self.triangulation_layer, (0, 0), special_flags=pg.BLEND_RGB_MAX)
+        self.full_update = True
+
+    def draw_triangulation(self, budget=constant_parameters.TRIANGULATION_EDGES_PER_FRAME):
+        """
+        Draw up to budget queued triangulation edges into the layer and blend the area
+        they cover onto the screen; call every frame before draw_polygon.
+        """
+        if len(self.triangulation_edges) == 0:
+            return
+        chunk, self.triangulation_edges = self.triangulation_edges[:budget], self.triangulation_edges[budget:]
+        for a, b in chunk.tolist():
+            pg.draw.aaline(self.triangulation_layer, constant_parameters.TRIANGULATION_EDGE_COLOR, a, b)
+        lower, upper = chunk.reshape(-1, 2).min(axis=0), chunk.reshape(-1, 2).max(axis=0)
+        lower, upper = np.floor(lower).astype(int) - 1, np.ceil(upper).astype(int) + 2
+        rect = pg.Rect(lower[0], lower[1], upper[0] - lower[0], upper[1] - lower[1]).clip(self.screen.get_rect())
+        # Trails never go below the background, so the maximum keeps them over the edges
+        self.screen.blit(self.triangulation_layer, rect, area=rect, special_flags=pg.BLEND_RGB_MAX)
+        self.mark_dirty(rect)
+
+    def draw_polygon(self, vertices, draw_edges=True):
+        """Draw polygon edges and vertices (array or Polygon) over the trails of previous frames."""
+        rect = self.polygon_rect(vertices if isinstance(vertices, Polygon) else np.asarray(vertices, dtype=np.float64))
+        vertices = np.asarray(vertices, dtype=np.float64)
+        if draw_edges:
+            pg.draw.aalines(self.screen, self.edge_color, True, vertices.tolist())
+        self.draw_vertices(vertices)
+        self.mark_dirty(rect)
+
+    def draw_vertices(self, vertices):
+        """Stamp all vertices into the pixel array at once, colored by their index."""
+        n = len(vertices)
+        colors = np.zeros((n, 3), dtype=np.uint8)
+        colors[:, 0] = (10 * np.arange(n) + 30) % 256
+        colors[:, 1] = 15
+        colors = np.maximum(colors, self.background)
+        radius = constant_parameters.POINT_RADIUS
+        width, height = self.screen.get_size()
+        centers = np.rint(vertices).astype(np.int64)
+        pixels = pg.surfarray.pixels3d(self.screen)
+        try:
+            for dx in range(-radius, radius + 1):
+                for dy in range(-radius, radius + 1):
+                    if dx * dx + dy * dy > radius * radius:
+                        continue
+                    x, y = centers[:, 0] + dx, centers[:, 1] + dy
+                    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+                    pixels[x[inside], y[inside]] = colors[inside]
+        finally:
+            del pixels
+
+    def polygon_rect(self, vertices):
+        lower, upper = vertices.bbox if isinstance(vertices, Polygon) else (vertices.min(axis=0), vertices.max(axis=0))
+        lower = np.floor(lower).astype(int) - constant_parameters.POINT_RADIUS - 2
+        upper = np.ceil(upper).astype(int) + constant_parameters.POINT_RADIUS + 2
+        return pg.Rect(lower[0], lower[1], upper[0] - lower[0], upper[1] - lower[1]).clip(self.screen.get_rect())
+
+    def mark_dirty(self, rect):
+        self.dirty.append(pg.Rect(rect))
+
+    def present(self):
+        """Push the frame to the display, only the dirty rectangles unless a full update is due."""
+        if self.full_update:
+            pg.display.flip()
+            self.full_update = False
+        elif self.dirty:
+            pg.display.update(self.dirty)
+        self.dirty = []
@@ -0,0 +1,157 @@
+import numpy as np
+
+from src.is_simple_polygon import crossing_edges
+from src.point_on_segment import point_on_segment
+from src.segments_intersect import segments_intersect
+
+
+class SegmentGrid:
+    """
+    Uniform grid over polygon edges for edge crossing checks of vertex moves.
+
+    Edge i goes from vertex i to vertex i+1 and is registered in every cell its
+    bounding box overlaps. Moving a vertex re-registers only its two edges, so
+    the grid is built once per polygon and maintained while the polygon jams.
+    Batches of moves (safe_moves) are checked with vectorized bucketing instead,
+    after which the cells are rebuilt only when a single move is checked again.
+    """
+
+    def __init__(self, points, cell_size=None):
+        """
+        Args:
+            points: array of shape (n, 2) with polygon vertices in order.
+            cell_size: side of a grid cell; defaults to the mean edge length.
+        """
+        self.points = np.array(points, dtype=np.float64)
+        if cell_size is None:
+            edges = np.roll(self.points, -1, axis=0) - self.points
+            cell_size = float(np.mean(np.hypot(edges[:, 0], edges[:, 1])))
+        self.cell_size = cell_size if cell_size > 0 else 1.0
+        self.cells = None
+        self.build()
+
+    def build(self):
+        """Register every edge in a fresh set of cells."""
+        self.origin = self.points.min(axis=0)
+        self.cells = dict()
+        self.edge_cells = [None] * len(self.points)
+        for e in range(len(self.points)):
+            self.register(e)
+
+    def __len__(self):
+        return len(self.points)
+
+    def cell_range(self, a, b):
+        """Return (x0, y0, x1, y1) cell range covering the bounding box of segment a-b."""
+        lower = np.floor((np.minimum(a, b) - self.origin) / self.cell_size).astype(np.int64)
+        upper = np.floor((np.maximum(a, b) - self.origin) / self.cell_size).astype(np.int64)
+        return lower[0], lower[1], upper[0], upper[1]
+
+    def register(self, e):
+        n = len(self.points)
+        x0, y0, x1, y1 = self.edge_cells[e] = self.cell_range(self.points[e], self.points[(e + 1) % n])
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells.setdefault((cx, cy), set()).add(e)
+
+    def unregister(self, e):
+        x0, y0, x1, y1 = self.edge_cells[e]
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells[(cx, cy)]
+                bucket.discard(e)
+                if not bucket:
+                    del self.cells[(cx, cy)]
+
+    def move_vertex(self, i, position):
+        """Move vertex i and re-register its two adjacent edges."""
+        if self.cells is None:
+            self.points[i] = position
+            return
+        n = len(self.points)
+        for e in ((i - 1) % n, i):
+            self.unregister(e)
+        self.points[i] = position
+        for e in ((i - 1) % n, i):
+            self.register(e)
+
+    def query_segment(self, a, b):
+        """Return set of edges registered in cells overlapping the bounding box of segment a-b."""
+        if self.cells is None:
+            self.build()
+        x0, y0, x1, y1 = self.cell_range(a, b)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) >= len(self.points):
+            return set(range(len(self.points)))
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return found
+
+    def move_is_safe(self, i, position):
+        """
+        Check that moving vertex i to position keeps the polygon simple:
+        neither of its two new edges crosses a non-adjacent edge, and neither
+        folds back onto the adjacent edge it shares an endpoint with.
+        """
+        n = len(self.points)
+        if n < 4:
+            return True
+        prev, nxt = self.points[(i - 1) % n], self.points[(i + 1) % n]
+        before, after = self.points[(i - 2) % n], self.points[(i + 2) % n]
+        if point_on_segment(position, before, prev) or point_on_segment(before, prev, position):
+            return False
+        if point_on_segment(position, nxt, after) or point_on_segment(after, nxt, position):
+            return False
+        # Edges replaced by the move, or sharing an endpoint with a new edge, are skipped
+        replaced = {(i - 1) % n, i}
+        for a, b, adjacent in ((prev, position, (i - 2) % n), (position, nxt, (i + 1) % n)):
+            for e in self.query_segment(a, b) - replaced - {adjacent}:
+                if segments_intersect(a, b, self.points[e], self.points[(e + 1) % n]):
+                    return False
+        return True
+
+    def safe_moves(self, indices, positions):
+        """
+        Move a batch of vertices at once, keeping the polygon simple.
+
+        All moves are applied together and the polygon is checked with
+        crossing_edges on the edges they change; the moves of vertices ending
+        up on a crossing or fold are rejected, and the check is repeated for
+        the rest until none remain. Moves are judged against each other, not
+        one by one in order as with move_is_safe.
+
+        Args:
+            indices: array of shape (m,) with distinct vertex indices.
+            positions: array of shape (m, 2) with their new positions.
+
+        Returns:
+            Boolean array of shape (m,), True for the moves which were applied.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        positions = np.asarray(positions, dtype=np.float64)
+        accepted = np.ones(len(indices), dtype=bool)
+        n = len(self.points)
+        if not len(indices):
+            return accepted
+        if n < 4:
+            self.points[indices] = positions
+            self.cells = None
+            return accepted
+        while True:
+            moving = np.zeros(n, dtype=bool)
+            moving[indices[accepted]] = True
+            trial = self.points.copy()
+            trial[indices[accepted]] = positions[accepted]
+            folds, e, f = crossing_edges(trial, changed=moving | np.roll(moving, -1))
+            # Every fold and crossing involves a changed edge, so at least one moved vertex
+            involved = np.concatenate([folds - 1, folds, folds + 1, e, e + 1, f, f + 1]) % n
+            rejected = involved[moving[involved]]
+            if not len(rejected):
+                break
+            accepted &= ~np.isin(indices, rejected)
+        self.points = trial
+        self.cells = None
+        return accepted
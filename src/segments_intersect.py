@@ -1,4 +1,7 @@
-from src.orientation import orientation
+import numpy as np
+
+from src.geometry_backends import numpy_point_on_segment
+from src.point_on_segment import point_on_segment
 
 def segments_intersect(p1, p2, q1, q2):
     """Check if segments (p1,p2) and (q1,q2) intersect."""
@@ -26,3 +29,29 @@ def segments_intersect(p1, p2, q1, q2):
         return True
 
     return False
+
+def segments_intersect_array(p1, p2, q1, q2):
+    """
+    Vectorized counterpart of segments_intersect for arrays of segments.
+    Row k of the result tells whether segment (p1[k], p2[k]) intersects (q1[k], q2[k]),
+    with the same tolerances as the scalar function.
+
+    Args:
+        p1, p2, q1, q2: arrays of shape (m, 2) with segment endpoints.
+
+    Returns:
+        Boolean array of shape (m,).
+    """
+    def orientation(a, b, c):
+        val = (b[:, 1]-a[:, 1])*(c[:, 0]-b[:, 0]) - (b[:, 0]-a[:, 0])*(c[:, 1]-b[:, 1])
+        return np.where(np.abs(val) < 1e-14, 0, np.where(val > 0, 1, 2))
+
+    o1 = orientation(p1, p2, q1)
+    o2 = orientation(p1, p2, q2)
+    o3 = orientation(q1, q2, p1)
+    o4 = orientation(q1, q2, p2)
+    return (((o1 != o2) & (o3 != o4))
+            | ((o1 == 0) & numpy_point_on_segment(q1, p1, p2))
+            | ((o2 == 0) & numpy_point_on_segment(q2, p1, p2))
+            | ((o3 == 0) & numpy_point_on_segment(p1, q1, q2))
+            | ((o4 == 0) & numpy_point_on_segment(p2, q1, q2)))
@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from src.check_belonging_to_polygon import POSITION_NAMES
+from src.engine import JammingSimulation
+from src.polygon import Polygon
+
+
+class SimulationWorker:
+    """
+    Steps a JammingSimulation on a background thread.
+
+    Vertices are published through a double buffer: the worker copies the
+    result of every step into the back buffer and swaps it to the front under
+    a short lock, so the render loop always reads a complete, consistent
+    polygon and never waits for a step to finish.
+
+    All calls on the simulation happen on the worker thread; the render loop
+    only sends commands (direction, replacement polygon) and reads snapshots.
+    Replacement simulations are built on the worker thread as well, since
+    building their indices takes long enough to drop frames for large polygons.
+    The optional recorder is written on the worker thread too, with the first
+    frame of every polygon taken over and every published step, so dropped
+    steps of a replaced polygon never reach the trajectory.
+    """
+
+    def __init__(self, simulation, recorder=None):
+        """
+        Args:
+            simulation: JammingSimulation to step; replace its polygon later with set_simulation.
+                It should have no recorder of its own.
+            recorder: optional TrajectoryWriter receiving published frames.
+        """
+        self.lock = threading.Lock()
+        self.wakeup = threading.Condition(self.lock)
+        self.direction = None
+        self.pending_simulation = None
+        self.reactivate_pending = False
+        self.position_query = None
+        self.position_answer = None
+        self.stopped = False
+        self.last_metrics = None
+        self.step_times = deque()
+        self.simulation = simulation
+        self.recorder = recorder
+        self.publish_buffers(simulation.vertices)
+        self.thread = threading.Thread(target=self.run, name="jamming", daemon=True)
+
+    def publish_buffers(self, vertices):
+        """Allocate both buffers for a new polygon and publish its vertices. Call with lock held or before start."""
+        self.buffers = [np.array(vertices, dtype=np.float64), np.array(vertices, dtype=np.float64)]
+        self.front = 0
+        self.version = 0
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Ask the worker to finish after the current step and wait for it."""
+        with self.lock:
+            self.stopped = True
+            self.wakeup.notify()
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def set_direction(self, inward):
+        """Jam in (True), expand (False) or pause (None); every vertex is re-evaluated."""
+        with self.lock:
+            self.direction = inward
+            self.reactivate_pending = True
+            self.wakeup.notify()
+
+    def set_simulation(self, vertices, **options):
+        """
+        Replace the polygon; the new one is shown immediately and stepped once the
+        worker has built its JammingSimulation.
+
+        Args:
+            vertices: array of shape (n, 2) with the new polygon vertices in order.
+            options: keyword arguments of JammingSimulation.
+        """
+        vertices = np.array(vertices, dtype=np.float64)
+        with self.lock:
+            self.pending_simulation = vertices, options
+            self.publish_buffers(vertices)
+            self.last_metrics = None
+            self.wakeup.notify()
+
+    def snapshot(self):
+        """
+        Return the latest published vertices.
+
+        Returns:
+            Tuple (read-only Polygon, version increasing with every published step).
+        """
+        with self.lock:
+            vertices = self.buffers[self.front].copy()
+            version = self.version
+        vertices.flags.writeable = False
+        return Polygon(vertices, copy=False), version
+
+    def query_position(self, point):
+        """
+        Ask for the position of point with respect to the polygon. The worker answers
+        between steps with the prepared index of the simulation, so the render loop
+        neither waits nor scans the polygon itself.
+
+        Returns:
+            Latest answer as a tuple (point, position name), or None before the first one.
+        """
+        with self.lock:
+            self.position_query = tuple(point)
+            self.wakeup.notify()
+            return self.position_answer
+
+    def answer_position(self, simulation, point):
+        code = simulation.prepared.classify_point(float(point[0]), float(point[1]))
+        with self.lock:
+            self.position_answer = point, POSITION_NAMES[code]
+
+    def statistics(self):
+        """Return metrics of the last step and the number of steps taken during the last second."""
+        with self.lock:
+            now = time.perf_counter()
+            while self.step_times and self.step_times[0] < now - 1.0:
+                self.step_times.popleft()
+            return self.last_metrics, len(self.step_times)
+
+    def record(self, simulation):
+        if self.recorder is not None:
+            self.recorder.append(simulation.vertices, simulation.iteration)
+
+    def run(self):
+        self.record(self.simulation)
+        while True:
+            with self.lock:
+                while (not self.stopped and self.direction is None and self.pending_simulation is None
+                       and self.position_query is None):
+                    self.wakeup.wait()
+                if self.stopped:
+                    return
+                pending = self.pending_simulation
+                self.pending_simulation = None
+                if pending is None and self.reactivate_pending:
+                    self.simulation.reactivate()
+                    self.reactivate_pending = False
+                inward = self.direction
+                simulation = self.simulation
+                query = self.position_query if pending is None else None
+                if query is not None:
+                    self.position_query = None
+            if pending is not None:
+                vertices, options = pending
+                simulation = JammingSimulation(vertices, **options)
+                with self.lock:
+                    if self.pending_simulation is not None:
+                        # Replaced again while being built
+                        continue
+                    self.simulation = simulation
+                self.record(simulation)
+                continue
+            if query is not None:
+                self.answer_position(simulation, query)
+            if inward is None:
+                continue
+
+            metrics = simulation.step(inward=inward)
+
+            with self.lock:
+                if self.pending_simulation is not None:
+                    # The stepped polygon was replaced meanwhile, drop its result
+                    continue
+                back = 1 - self.front
+                if len(self.buffers[back]) == len(simulation.vertices):
+                    self.buffers[back][:] = simulation.vertices
+                else:
+                    self.buffers[back] = np.array(simulation.vertices, dtype=np.float64)
+                self.front = back
+                self.version += 1
+                self.last_metrics = metrics
+                self.step_times.append(time.perf_counter())
+            # Only the worker thread changes the vertices, reading them outside the lock is safe
+            self.record(simulation)
@@ -0,0 +1,52 @@
+class StopCriteria:
+    """
+    Decides when a jamming run is done, from the metrics of its steps.
+
+    A run stops after max_iterations steps, or once the largest vertex shift
+    stayed at or below shift_tolerance for patience consecutive steps.
+    With the default tolerance of 0 the run stops when no vertex moves anymore.
+    Only steps evaluating every vertex count as standing: after a standing step
+    over the active vertices alone (metrics["partial"]), needs_sweep asks the
+    simulation to evaluate all of them in the next one.
+    """
+
+    def __init__(self, max_iterations=None, shift_tolerance=0.0, patience=1):
+        """
+        Args:
+            max_iterations: maximal number of steps, None for no limit.
+            shift_tolerance: largest vertex shift still considered standing, None to never converge.
+            patience: number of consecutive standing steps required to converge.
+        """
+        if max_iterations is None and shift_tolerance is None:
+            raise ValueError("Either max_iterations or shift_tolerance is required.")
+        self.max_iterations = max_iterations
+        self.shift_tolerance = shift_tolerance
+        self.patience = patience
+        self.reset()
+
+    def reset(self):
+        self.steps = 0
+        self.standing = 0
+        self.needs_sweep = False
+
+    def __call__(self, metrics):
+        """
+        Account one step.
+
+        Returns:
+            "converged" or "max_iterations" if the run should stop, None otherwise.
+        """
+        self.steps += 1
+        self.needs_sweep = False
+        if self.shift_tolerance is not None and metrics["max_shift"] <= self.shift_tolerance:
+            if metrics.get("partial", False):
+                self.needs_sweep = True
+            else:
+                self.standing += 1
+        else:
+            self.standing = 0
+        if self.standing >= self.patience:
+            return "converged"
+        if self.max_iterations is not None and self.steps >= self.max_iterations:
+            return "max_iterations"
+        return None
@@ -0,0 +1,107 @@
+import os
+
+import numpy as np
+
+# Index row of a frame: offset of its first coordinate in the data file, vertex count, iteration
+INDEX_COLUMNS = 3
+
+
+def index_path(path):
+    return path + ".index"
+
+
+class TrajectoryWriter:
+    """
+    Append-only recorder of polygon vertices, one frame per jamming iteration.
+
+    Frames go to two files: path holds the coordinates of all frames back to back
+    as little endian float64 x,y pairs, and path.index holds one int64 row
+    (offset, vertex count, iteration) per frame. The vertex count may change
+    between frames. Every frame is written straight through to the files, so
+    long runs never keep their history in memory, and flushed (data before index)
+    so that a TrajectoryReader following the run sees it after refresh().
+    Appending is not thread-safe, a writer belongs to one thread.
+    """
+
+    def __init__(self, path, append=False, flush_every=1):
+        """
+        Args:
+            path: data file; the index is written next to it (see index_path).
+            append: continue an existing trajectory instead of truncating it.
+            flush_every: flush the files after every this many frames.
+        """
+        mode = "ab" if append else "wb"
+        self.path = path
+        self.flush_every = flush_every
+        self.pending = 0
+        self.data = open(path, mode)
+        self.index = open(index_path(path), mode)
+        self.offset = self.data.seek(0, os.SEEK_END) // 8
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def append(self, vertices, iteration=0):
+        """Write vertices of shape (n, 2) as the next frame."""
+        frame = np.ascontiguousarray(vertices, dtype="<f8").reshape(-1, 2)
+        self.data.write(frame.tobytes())
+        self.index.write(np.array([self.offset, len(frame), iteration], dtype="<i8").tobytes())
+        self.offset += frame.size
+        self.pending += 1
+        if self.pending >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        # Data first, a reader never sees an index row before the coordinates it points to
+        self.data.flush()
+        self.index.flush()
+        self.pending = 0
+
+    def close(self):
+        self.data.close()
+        self.index.close()
+
+
+class TrajectoryReader:
+    """
+    Random access to a trajectory written by TrajectoryWriter.
+
+    Both files are memory-mapped, so seeking to any frame is O(1) and only the
+    pages of frames actually read are loaded. Frames appended after opening
+    become visible after refresh().
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.refresh()
+
+    def refresh(self):
+        """Map the files again, picking up frames appended meanwhile."""
+        index_size = os.path.getsize(index_path(self.path)) // (8 * INDEX_COLUMNS)
+        data_size = os.path.getsize(self.path) // 8
+        if index_size == 0:
+            self.index = np.zeros((0, INDEX_COLUMNS), dtype="<i8")
+            self.data = np.zeros(0, dtype="<f8")
+            return
+        self.index = np.memmap(index_path(self.path), dtype="<i8", mode="r", shape=(index_size, INDEX_COLUMNS))
+        self.data = np.memmap(self.path, dtype="<f8", mode="r", shape=(data_size,))
+        # A frame whose coordinates are not completely written yet is not part of the trajectory
+        complete = self.index[:, 0] + 2 * self.index[:, 1] <= data_size
+        self.index = self.index[:np.argmin(complete) if not complete.all() else index_size]
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, i):
+        """Return frame i as a read-only array of shape (n, 2), negative i counts from the end."""
+        offset, n, _ = self.index[i]
+        return self.data[offset:offset + 2 * n].reshape(n, 2)
+
+    def iteration(self, i):
+        return int(self.index[i, 2])
+
+    def vertex_counts(self):
+        return np.asarray(self.index[:, 1])
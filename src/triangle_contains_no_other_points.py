@@ -1,9 +1,24 @@
-def triangle_contains_no_other_points(triangle_pts, all_points, exclude_indices):
-    """Return True if no other points except exclude_indices are inside the triangle."""
-    v1, v2, v3 = triangle_pts
-    for idx, pt in enumerate(all_points):
-        if idx in exclude_indices:
-            continue
-        if point_in_triangle(pt, v1, v2, v3):
-            return False
-    return True
+import numpy as np
+
+def triangle_contains_no_other_points(triangle_pts, all_points, exclude_indices, candidates=None):
+    """
+    Return True if no other points except exclude_indices are inside the triangle.
+    Uses the sign (barycentric) test of point_in_triangle, vectorized over the points.
+    If candidates (indices into all_points) are given, only those points are tested.
+    """
+    all_points = np.asarray(all_points, dtype=np.float64)
+    if candidates is None:
+        candidates = np.arange(len(all_points))
+    candidates = np.setdiff1d(candidates, list(exclude_indices))
+    if len(candidates) == 0:
+        return True
+    pt = all_points[candidates]
+    v1, v2, v3 = np.asarray(triangle_pts, dtype=np.float64)
+
+    def sign(p1, p2, p3):
+        return (p1[:, 0] - p3[0])*(p2[1] - p3[1]) - (p2[0] - p3[0])*(p1[:, 1] - p3[1])
+
+    b1 = sign(pt, v1, v2) < 0.0
+    b2 = sign(pt, v2, v3) < 0.0
+    b3 = sign(pt, v3, v1) < 0.0
+    return not np.any((b1 == b2) & (b2 == b3))
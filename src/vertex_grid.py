@@ -0,0 +1,142 @@
+import numpy as np
+
+from src.jammer import triplets, points_strictly_in_triangles
+
+
+class VertexGrid:
+    """
+    Uniform grid over polygon vertices for the "triangle contains no other vertex" check.
+
+    Each cell keeps the set of vertex indices lying in it. The grid is kept in sync
+    with moving vertices by update(), which only touches vertices that changed cell,
+    so it is built once per polygon and then maintained across jamming steps.
+    """
+
+    def __init__(self, points, cell_size=None):
+        """
+        Args:
+            points: array of shape (n, 2) with polygon vertices in order.
+            cell_size: side of a grid cell; defaults to the mean edge length,
+                so a triplet triangle usually spans only a few cells.
+        """
+        self.points = np.array(points, dtype=np.float64)
+        if cell_size is None:
+            edges = np.roll(self.points, -1, axis=0) - self.points
+            cell_size = float(np.mean(np.hypot(edges[:, 0], edges[:, 1])))
+        self.cell_size = cell_size if cell_size > 0 else 1.0
+        self.origin = self.points.min(axis=0)
+        self.cell_of = self.cells_of(self.points)
+        self.cells = dict()
+        for idx, cell in enumerate(map(tuple, self.cell_of)):
+            self.cells.setdefault(cell, set()).add(idx)
+
+    def __len__(self):
+        return len(self.points)
+
+    def cells_of(self, points):
+        """Return integer cell coordinates of shape (n, 2) for given points."""
+        return np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+
+    def update(self, points):
+        """
+        Move vertices to new positions, re-bucketing only those which changed cell.
+
+        Args:
+            points: array of shape (n, 2) with new positions of the same vertices.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        new_cells = self.cells_of(points)
+        for idx in np.flatnonzero(np.any(new_cells != self.cell_of, axis=1)):
+            old_cell = tuple(self.cell_of[idx])
+            bucket = self.cells[old_cell]
+            bucket.discard(idx)
+            if not bucket:
+                del self.cells[old_cell]
+            self.cells.setdefault(tuple(new_cells[idx]), set()).add(idx)
+        self.cell_of = new_cells
+        self.points[...] = points
+
+    def move_vertex(self, i, position):
+        """Move a single vertex, re-bucketing it if it changed cell."""
+        new_cell = self.cells_of(np.asarray(position, dtype=np.float64)[None, :])[0]
+        if np.any(new_cell != self.cell_of[i]):
+            old_cell = tuple(self.cell_of[i])
+            bucket = self.cells[old_cell]
+            bucket.discard(i)
+            if not bucket:
+                del self.cells[old_cell]
+            self.cells.setdefault(tuple(new_cell), set()).add(i)
+            self.cell_of[i] = new_cell
+        self.points[i] = position
+
+    def query_box(self, lower, upper):
+        """Return indices of vertices in cells overlapping the box [lower, upper]."""
+        (x0, y0), (x1, y1) = self.cells_of(np.array([lower, upper]))
+        if (x1 - x0 + 1) * (y1 - y0 + 1) >= len(self.points):
+            return list(range(len(self.points)))
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def triangles_near(self, positions):
+        """
+        Mask of vertices whose triplet triangle may be affected by given positions:
+        the bounding box of the triangle overlaps a cell containing one of them.
+
+        Args:
+            positions: array of shape (m, 2), e.g. old and new positions of moved vertices.
+        """
+        n = len(self.points)
+        near = np.zeros(n, dtype=bool)
+        if not len(positions):
+            return near
+        key = lambda cells: (cells[:, 0] << 32) | (cells[:, 1] & 0xFFFFFFFF)
+        marked = np.unique(key(self.cells_of(np.asarray(positions, dtype=np.float64))))
+        a, b, c = triplets(self.points)
+        lower = self.cells_of(np.minimum(np.minimum(a, b), c))
+        upper = self.cells_of(np.maximum(np.maximum(a, b), c))
+        width = upper[:, 0] - lower[:, 0] + 1
+        spans = width * (upper[:, 1] - lower[:, 1] + 1)
+        # Triangles spanning as many cells as there are vertices are taken as near, as in query_box
+        huge = spans >= n
+        near[huge] = True
+        spans[huge] = 0
+        owners = np.repeat(np.arange(n), spans)
+        within = np.arange(len(owners)) - np.repeat(np.cumsum(spans) - spans, spans)
+        cells = np.column_stack([lower[owners, 0] + within % width[owners],
+                                 lower[owners, 1] + within // width[owners]])
+        near[owners[np.isin(key(cells), marked)]] = True
+        return near
+
+    def empty_triangles(self, rows=None):
+        """
+        Grid-backed equivalent of jammer.empty_triangles for the indexed vertices:
+        only vertices inside the bounding box of each triplet triangle are tested.
+        If rows are given, only those vertices are tested and the rest are reported False.
+        """
+        n = len(self.points)
+        a, b, c = triplets(self.points)
+        lower = np.minimum(np.minimum(a, b), c)
+        upper = np.maximum(np.maximum(a, b), c)
+        if rows is None:
+            rows = np.arange(n)
+        owners, candidates = [np.zeros(0, dtype=np.int64)], [[]]
+        for i in rows:
+            found = self.query_box(lower[i], upper[i])
+            owners.append(np.full(len(found), i))
+            candidates.append(found)
+        owners = np.concatenate(owners)
+        candidates = np.concatenate(candidates).astype(np.int64)
+        offset = (candidates - owners) % n
+        keep = (offset != 0) & (offset != 1) & (offset != n - 1)
+        owners, candidates = owners[keep], candidates[keep]
+        inner = points_strictly_in_triangles(self.points[candidates],
+                                             a[owners], b[owners], c[owners])
+        empty = np.zeros(n, dtype=bool)
+        empty[rows] = True
+        empty[owners[inner]] = False
+        return empty
@@ -0,0 +1,23 @@
+from src.adaptive_tempo import AdaptiveTempo
+
+
+def test_tempo_grows_while_moves_are_accepted():
+    controller = AdaptiveTempo(1.0, grow=2.0, max_tempo=5.0)
+    assert [controller.update(10, 10) for _ in range(4)] == [2.0, 4.0, 5.0, 5.0]
+
+
+def test_tempo_shrinks_when_rejections_increase():
+    controller = AdaptiveTempo(4.0, grow=2.0, shrink=0.5, min_tempo=0.75)
+    assert controller.update(8, 10) == 8.0
+    assert controller.update(5, 10) == 4.0
+    assert controller.update(5, 10) == 8.0
+    assert controller.update(0, 10) == 4.0
+    assert controller.update(0, 20) == 2.0
+    assert controller.update(0, 40) == 1.0
+    assert controller.update(0, 80) == 0.75
+
+
+def test_tempo_holds_when_nothing_moves_without_new_rejections():
+    controller = AdaptiveTempo(3.0)
+    controller.update(0, 10)
+    assert controller.update(0, 10) == 3.0
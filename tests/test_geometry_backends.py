@@ -0,0 +1,33 @@
+import pytest
+
+from src import geometry_backends
+from src.geometry_backends import KERNELS, available_backends, check_equivalence, equivalence_cases, kernel
+
+# numba is listed even when it is not installed, so that the run reports it as skipped
+BACKENDS = sorted(set(available_backends()) | {"numba"})
+
+
+def test_equivalence_cases_cover_every_outcome():
+    # Otherwise a backend returning a constant could still match the reference
+    for name, arguments in equivalence_cases().items():
+        outcomes = {kernel(name, "python")(*args) for args in arguments}
+        expected = {0, 1, 2, 3} if name == "orientation_type" else {False, True}
+        assert outcomes == expected, name
+
+
+def test_mismatches_are_reported(monkeypatch):
+    broken = dict(geometry_backends._backends["python"])
+    broken["point_on_segment"] = lambda p, a, b, eps=1e-9: False
+    monkeypatch.setitem(geometry_backends._backends, "broken", broken)
+    mismatches = check_equivalence(["broken"])
+    assert mismatches[("broken", "point_on_segment")] > 0
+    assert all(mismatches[("broken", name)] == 0 for name in KERNELS if name != "point_on_segment")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_matches_python(backend):
+    if backend not in available_backends():
+        pytest.skip(f"{backend} backend is not available")
+    mismatches = check_equivalence([backend])
+    assert sorted(name for _, name in mismatches) == sorted(KERNELS)
+    assert {key: count for key, count in mismatches.items() if count} == {}
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from src.polygon import Polygon
+from src.polygon_area import polygon_area
+
+SQUARE = np.array([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [0.0, 2.0]])
+
+
+def test_caches_follow_writes():
+    polygon = Polygon(SQUARE)
+    assert polygon.area == 4.0 and polygon.winding == 1
+    polygon.move_vertices([2], [[4.0, 4.0]])
+    np.testing.assert_array_equal(polygon.bbox[1], [4.0, 4.0])
+    assert polygon.area == polygon_area(polygon.vertices)
+    np.testing.assert_array_equal(polygon.edge_vectors, np.roll(polygon.vertices, -1, axis=0) - polygon.vertices)
+
+
+def test_buffer_is_read_only_and_copied_by_default():
+    vertices = SQUARE.copy()
+    polygon = Polygon(vertices)
+    vertices[0] = [-1.0, -1.0]
+    np.testing.assert_array_equal(polygon.vertices, SQUARE)
+    with pytest.raises(ValueError):
+        np.asarray(polygon)[0] = [1.0, 1.0]
+
+
+def test_taken_over_buffer_needs_invalidate():
+    vertices = SQUARE.copy()
+    polygon = Polygon(vertices, copy=False)
+    assert polygon.area == 4.0
+    vertices[2] = [4.0, 4.0]
+    polygon.invalidate()
+    assert polygon.area == polygon_area(vertices)
+    np.testing.assert_array_equal(polygon.bbox[1], [4.0, 4.0])
@@ -0,0 +1,41 @@
+import os
+
+import numpy as np
+
+from src.generate_points_and_polygon import generate_points_and_polygon
+from src.polygon_cache import PolygonCache
+
+
+def test_store_and_load_round_trip(tmp_path):
+    cache = PolygonCache(str(tmp_path))
+    points, simplices, order = np.random.default_rng(0).random((10, 2)), np.arange(9).reshape(3, 3), np.arange(10)
+    assert cache.load("entry") is None
+    cache.store("entry", points, simplices, order)
+    for stored, loaded in zip((points, simplices, order), cache.load("entry")):
+        np.testing.assert_array_equal(loaded, stored)
+
+
+def test_cached_polygon_matches_a_fresh_one(tmp_path):
+    cache = PolygonCache(str(tmp_path))
+    fresh = generate_points_and_polygon(seed=3, num_points=40)
+    stored = generate_points_and_polygon(seed=3, num_points=40, cache=cache)
+    loaded = generate_points_and_polygon(seed=3, num_points=40, cache=cache)
+    assert len(cache.entries()) == 1
+    for result in (stored, loaded):
+        np.testing.assert_array_equal(result[0], fresh[0])
+        np.testing.assert_array_equal(result[2].simplices, fresh[2].simplices)
+        np.testing.assert_array_equal(result[3], fresh[3])
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = PolygonCache(str(tmp_path), max_entries=2)
+    entry = np.zeros((3, 2)), np.zeros((1, 3), dtype=np.int64), np.arange(3)
+    cache.store("a", *entry)
+    cache.store("b", *entry)
+    # Entries are ordered by modification time, set explicitly so that the test does not depend on its resolution
+    os.utime(cache.path("a"), (1, 1))
+    os.utime(cache.path("b"), (2, 2))
+    cache.load("a")
+    cache.store("c", *entry)
+    assert cache.load("b") is None
+    assert cache.load("a") is not None and cache.load("c") is not None
@@ -0,0 +1,73 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.engine import random_polygon
+from src.is_simple_polygon import is_simple_polygon
+from src.polygon_io import export_trajectory, load_polygon, read_csv, read_vertices, save_polygon
+from src.trajectory import TrajectoryReader, TrajectoryWriter
+
+
+@pytest.mark.parametrize("extension", ["npy", "csv", "txt", "wkt", "geojson", "json"])
+def test_save_and_read_round_trip(tmp_path, extension):
+    points = random_polygon(0, 50)
+    path = str(tmp_path / f"polygon.{extension}")
+    save_polygon(path, points)
+    np.testing.assert_array_equal(read_vertices(path), points)
+    vertices, built = load_polygon(path)
+    assert not built
+    np.testing.assert_array_equal(vertices, points)
+
+
+def test_small_chunks_give_the_same_csv(tmp_path):
+    points = random_polygon(1, 200)
+    path = str(tmp_path / "polygon.csv")
+    save_polygon(path, points)
+    np.testing.assert_array_equal(read_csv(path, chunk_size=37), points)
+
+
+def test_z_coordinates_are_dropped(tmp_path):
+    path = tmp_path / "polygon.wkt"
+    path.write_text("POLYGON Z ((0 0 1, 4 0 2, 4 3 3, 0 0 1))\n")
+    np.testing.assert_array_equal(read_vertices(str(path)), [[0, 0], [4, 0], [4, 3]])
+
+
+def test_point_cloud_gets_a_polygon(tmp_path):
+    points = np.random.default_rng(0).random((30, 2)) * 100
+    path = str(tmp_path / "cloud.npy")
+    np.save(path, points)
+    vertices, built = load_polygon(path)
+    assert built and is_simple_polygon(vertices)
+
+
+def test_unknown_extension_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        save_polygon(str(tmp_path / "polygon.shp"), random_polygon(0, 10))
+
+
+@pytest.mark.parametrize("extension", ["npy", "csv", "wkt", "geojson"])
+def test_export_trajectory(tmp_path, extension):
+    frames = [random_polygon(seed, 20) for seed in range(5)]
+    trajectory = str(tmp_path / "run.traj")
+    with TrajectoryWriter(trajectory) as writer:
+        for k, frame in enumerate(frames):
+            writer.append(frame, 10 * k)
+    path = str(tmp_path / f"run.{extension}")
+    export_trajectory(trajectory, path, every=2)
+    if extension == "npy":
+        np.testing.assert_array_equal(np.load(path), np.array(frames[::2]))
+    elif extension == "csv":
+        rows = np.loadtxt(path, delimiter=",", skiprows=1)
+        np.testing.assert_array_equal(rows[:, 0], np.repeat([0, 20, 40], 20))
+        np.testing.assert_array_equal(rows[:, 1:], np.concatenate(frames[::2]))
+    elif extension == "wkt":
+        lines = open(path).read().splitlines()
+        assert len(lines) == 3
+        (tmp_path / "last.wkt").write_text(lines[-1])
+        np.testing.assert_array_equal(read_vertices(str(tmp_path / "last.wkt")), frames[4])
+    else:
+        features = json.load(open(path))["features"]
+        assert [feature["properties"]["iteration"] for feature in features] == [0, 20, 40]
+        np.testing.assert_array_equal(features[1]["geometry"]["coordinates"][0][:-1], frames[2])
+    assert len(TrajectoryReader(trajectory)) == 5
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from src.check_belonging_to_polygon import classify_points
+from src.engine import random_polygon
+from src.prepared_polygon import PreparedPolygon
+
+
+def queries(points, rng, count=400):
+    """Random points around the polygon together with its vertices and edge midpoints."""
+    lower, upper = points.min(axis=0) - 10, points.max(axis=0) + 10
+    midpoints = (points + np.roll(points, -1, axis=0)) / 2
+    return np.concatenate([rng.uniform(lower, upper, (count, 2)), points, midpoints])
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_classify_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    points = random_polygon(seed, 80)
+    prepared = PreparedPolygon(points)
+    query = queries(points, rng)
+    expected = classify_points(query, points)
+    np.testing.assert_array_equal(prepared.classify(query), expected)
+    assert [prepared.classify_point(x, y) for x, y in query.tolist()] == expected.tolist()
+
+
+@pytest.mark.parametrize("batch", [1, 5, 40])
+def test_classify_follows_moved_vertices(batch):
+    # Small batches stay below the dirty edge limit, large ones rebuild the slab table
+    rng = np.random.default_rng(batch)
+    points = random_polygon(batch, 80)
+    prepared = PreparedPolygon(points)
+    for _ in range(10):
+        indices = rng.choice(len(points), batch, replace=False)
+        points = points.copy()
+        points[indices] += rng.normal(0, 5, (batch, 2))
+        prepared.move_vertices(indices, points[indices])
+        query = queries(points, rng, 100)
+        np.testing.assert_array_equal(prepared.classify(query), classify_points(query, points))
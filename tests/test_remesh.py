@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from src.check_belonging_to_polygon import classify_points, INNER, OUTER
+from src.engine import random_polygon
+from src.is_simple_polygon import is_simple_polygon
+from src.remesh import decimate, refine, remesh
+
+
+def square(per_side):
+    """Square of side 100 with per_side vertices on every side, counterclockwise."""
+    t = np.arange(per_side) / per_side * 100
+    zeros, full = np.zeros(per_side), np.full(per_side, 100.0)
+    return np.concatenate([np.column_stack(side) for side in
+                           ((t, zeros), (full, t), (100 - t, full), (zeros, 100 - t))])
+
+
+def beyond(points, polygon, side):
+    """Points on side (INNER or OUTER) of polygon, apart from those on its edges up to rounding."""
+    points = points[classify_points(points, polygon) == side]
+    a, b = polygon[None], np.roll(polygon, -1, axis=0)[None]
+    t = np.clip(((points[:, None] - a) * (b - a)).sum(axis=2) / ((b - a) ** 2).sum(axis=2), 0, 1)
+    distance = np.hypot(*(a + t[..., None] * (b - a) - points[:, None]).transpose(2, 0, 1)).min(axis=1)
+    return points[distance > 1e-9]
+
+
+def test_refine_splits_long_edges_along_them():
+    points = random_polygon(0, 30)
+    refined, inserted = refine(points, 20.0)
+    edges = np.roll(refined, -1, axis=0) - refined
+    assert inserted == len(refined) - len(points)
+    assert np.hypot(edges[:, 0], edges[:, 1]).max() <= 20.0 + 1e-9
+    # Original vertices are kept in order, the inserted ones lie on the original edges
+    kept = np.flatnonzero((refined[:, None] == points[None]).all(axis=2).any(axis=1))
+    np.testing.assert_array_equal(refined[kept], points)
+    assert is_simple_polygon(refined)
+
+
+def test_decimate_removes_collinear_vertices():
+    points = square(5)
+    decimated, removed = decimate(points, 0.01, 1.0, 1000.0)
+    assert removed == len(points) - len(decimated) > 0
+    assert is_simple_polygon(decimated)
+    # Corners are never collinear with their neighbours
+    for corner in ([0, 0], [100, 0], [100, 100], [0, 100]):
+        assert (decimated == corner).all(axis=1).any()
+
+
+@pytest.mark.parametrize("inward", [True, False])
+@pytest.mark.parametrize("seed", range(3))
+def test_remesh_keeps_the_polygon_on_one_side(seed, inward):
+    points = refine(random_polygon(seed, 60), 15.0)[0]
+    remeshed, removed, inserted = remesh(points, 0.2, 12.0, 40.0, min_vertices=20, inward=inward)
+    assert removed > 0 and len(remeshed) >= 20
+    assert is_simple_polygon(remeshed)
+    # Removing a reflex vertex leaves it inside the new polygon, removing a convex one outside;
+    # vertices removed from the chord of their neighbours stay on the new edge
+    assert len(beyond(points, remeshed, INNER if inward else OUTER)) == 0
+
+
+def test_remesh_rejects_oscillating_thresholds():
+    with pytest.raises(ValueError):
+        remesh(square(3), 0.01, 10.0, 15.0)
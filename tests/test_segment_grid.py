@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from src.engine import random_polygon
+from src.is_simple_polygon import is_simple_polygon
+from src.point_on_segment import point_on_segment
+from src.segment_grid import SegmentGrid
+from src.segments_intersect import segments_intersect
+
+
+def simple_by_all_pairs(points):
+    n = len(points)
+    for i in range(n):
+        if (point_on_segment(points[(i + 1) % n], points[i - 1], points[i])
+                or point_on_segment(points[i - 1], points[i], points[(i + 1) % n])):
+            return False
+    for e in range(n):
+        for f in range(e + 2, n):
+            if f - e != n - 1 and segments_intersect(points[e], points[(e + 1) % n], points[f], points[(f + 1) % n]):
+                return False
+    return True
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_is_simple_polygon_matches_all_pairs(seed):
+    rng = np.random.default_rng(seed)
+    points = random_polygon(seed, 30)
+    if seed % 2:
+        # Pull a vertex across the polygon, usually making it self-intersecting
+        i = rng.integers(len(points))
+        points[i] = points[(i + len(points) // 2) % len(points)] + rng.normal(0, 5, 2)
+    assert is_simple_polygon(points) == simple_by_all_pairs(points)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_move_is_safe_matches_all_pairs(seed):
+    rng = np.random.default_rng(seed)
+    points = random_polygon(seed, 40)
+    grid = SegmentGrid(points)
+    scale = np.ptp(points, axis=0).max() / 8
+    for i in rng.integers(len(points), size=40):
+        position = points[i] + rng.normal(0, scale, 2)
+        moved = points.copy()
+        moved[i] = position
+        assert grid.move_is_safe(i, position) == simple_by_all_pairs(moved)
+
+
+def test_query_segment_finds_every_overlapping_edge():
+    rng = np.random.default_rng(0)
+    points = random_polygon(0, 100)
+    grid = SegmentGrid(points)
+    ends = np.roll(points, -1, axis=0)
+    lower, upper = np.minimum(points, ends), np.maximum(points, ends)
+    for _ in range(20):
+        a, b = rng.uniform(points.min(axis=0), points.max(axis=0), (2, 2))
+        overlapping = np.flatnonzero(((np.minimum(a, b) <= upper) & (np.maximum(a, b) >= lower)).all(axis=1))
+        assert set(overlapping) <= grid.query_segment(a, b)
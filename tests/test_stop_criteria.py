@@ -0,0 +1,40 @@
+import pytest
+
+from src.stop_criteria import StopCriteria
+
+
+def step(max_shift, partial=False):
+    return {"max_shift": max_shift, "partial": partial}
+
+
+def test_stops_after_max_iterations():
+    criteria = StopCriteria(max_iterations=3, shift_tolerance=None)
+    assert [criteria(step(1.0)) for _ in range(3)] == [None, None, "max_iterations"]
+
+
+def test_converges_after_patience_standing_steps():
+    criteria = StopCriteria(shift_tolerance=0.1, patience=2)
+    assert criteria(step(0.05)) is None
+    assert criteria(step(0.5)) is None
+    assert criteria(step(0.05)) is None
+    assert criteria(step(0.0)) == "converged"
+
+
+def test_partial_steps_ask_for_a_sweep_instead_of_converging():
+    criteria = StopCriteria(shift_tolerance=0.0)
+    assert criteria(step(0.0, partial=True)) is None
+    assert criteria.needs_sweep
+    assert criteria(step(0.0)) == "converged"
+    assert not criteria.needs_sweep
+
+
+def test_reset_forgets_standing_steps():
+    criteria = StopCriteria(max_iterations=2, shift_tolerance=0.1, patience=2)
+    criteria(step(0.0))
+    criteria.reset()
+    assert criteria(step(0.0)) is None
+
+
+def test_needs_a_limit():
+    with pytest.raises(ValueError):
+        StopCriteria(max_iterations=None, shift_tolerance=None)
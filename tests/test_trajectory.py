@@ -0,0 +1,66 @@
+import threading
+
+import numpy as np
+
+from src.trajectory import TrajectoryReader, TrajectoryWriter
+
+
+def frame(k):
+    return np.arange(2 * (3 + k % 5), dtype=np.float64).reshape(-1, 2) + k
+
+
+def test_reader_follows_a_writer(tmp_path):
+    path = str(tmp_path / "run.traj")
+    writer = TrajectoryWriter(path)
+    writer.append(frame(0), 0)
+    reader = TrajectoryReader(path)
+    done = threading.Event()
+
+    def write():
+        for k in range(1, 500):
+            writer.append(frame(k), k)
+        done.set()
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    seen = 0
+    while not done.is_set() or seen < 500:
+        reader.refresh()
+        assert len(reader) >= seen
+        for i in range(seen, len(reader)):
+            assert reader.iteration(i) == i
+            np.testing.assert_array_equal(reader[i], frame(i))
+        seen = len(reader)
+        if done.is_set():
+            reader.refresh()
+            assert len(reader) == 500
+            seen = len(reader)
+    thread.join()
+    writer.close()
+
+
+def test_frames_round_trip(tmp_path):
+    path = str(tmp_path / "run.traj")
+    with TrajectoryWriter(path) as writer:
+        for k in range(10):
+            writer.append(frame(k), 3 * k)
+    with TrajectoryWriter(path, append=True) as writer:
+        writer.append(frame(10), 30)
+    reader = TrajectoryReader(path)
+    assert len(reader) == 11
+    np.testing.assert_array_equal(reader.vertex_counts(), [3 + k % 5 for k in range(11)])
+    for k in range(11):
+        assert reader.iteration(k) == 3 * k
+        np.testing.assert_array_equal(reader[k], frame(k))
+    np.testing.assert_array_equal(reader[-1], frame(10))
+
+
+def test_incomplete_frame_is_hidden(tmp_path):
+    path = str(tmp_path / "run.traj")
+    with TrajectoryWriter(path) as writer:
+        writer.append(frame(0))
+        writer.append(frame(1))
+    # Cut the coordinates of the last frame short, as if it were still being written
+    with open(path, "r+b") as f:
+        f.truncate(8 * 2 * len(frame(0)) + 8)
+    assert len(TrajectoryReader(path)) == 1
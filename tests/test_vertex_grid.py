@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from src.engine import random_polygon
+from src.jammer import empty_triangles, triplets
+from src.vertex_grid import VertexGrid
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_empty_triangles_match_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    points = random_polygon(seed, 100)
+    grid = VertexGrid(points)
+    np.testing.assert_array_equal(grid.empty_triangles(), empty_triangles(points))
+    rows = np.sort(rng.choice(len(points), 30, replace=False))
+    np.testing.assert_array_equal(grid.empty_triangles(rows), empty_triangles(points, rows))
+
+
+def test_grid_follows_moved_vertices():
+    rng = np.random.default_rng(0)
+    points = random_polygon(0, 100)
+    grid = VertexGrid(points)
+    for _ in range(5):
+        points = points + rng.normal(0, 10, points.shape)
+        grid.update(points)
+        np.testing.assert_array_equal(grid.empty_triangles(), empty_triangles(points))
+    for i in rng.choice(len(points), 20, replace=False):
+        points[i] += rng.normal(0, 30, 2)
+        grid.move_vertex(i, points[i])
+    np.testing.assert_array_equal(grid.empty_triangles(), empty_triangles(points))
+
+
+def test_query_box_finds_every_vertex_inside():
+    rng = np.random.default_rng(1)
+    points = random_polygon(1, 100)
+    grid = VertexGrid(points)
+    for _ in range(20):
+        lower = rng.uniform(points.min(axis=0), points.max(axis=0))
+        upper = lower + rng.uniform(0, 200, 2)
+        inside = np.flatnonzero(((points >= lower) & (points <= upper)).all(axis=1))
+        assert set(inside) <= set(grid.query_box(lower, upper))
+
+
+def test_triangles_near_covers_triangles_containing_positions():
+    rng = np.random.default_rng(2)
+    points = random_polygon(2, 100)
+    grid = VertexGrid(points)
+    positions = rng.uniform(points.min(axis=0), points.max(axis=0), (15, 2))
+    a, b, c = triplets(points)
+    lower, upper = np.minimum(np.minimum(a, b), c), np.maximum(np.maximum(a, b), c)
+    inside = ((positions[None] >= lower[:, None]) & (positions[None] <= upper[:, None])).all(axis=2).any(axis=1)
+    assert grid.triangles_near(positions)[inside].all()
+    assert not grid.triangles_near(np.zeros((0, 2))).any()